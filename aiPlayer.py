@@ -1,6 +1,7 @@
-from typing import Dict, Any, Tuple
+from typing import Tuple
 
 from action import Action
+from gameState import GameState
 from player import Player
 from strategy import BasicStrategy
 
@@ -19,8 +20,10 @@ class AIPlayer(Player):
         """
         super().__init__(name, chips)
         self.strategy = strategy or BasicStrategy()
+        # 缓存绑定方法，每次决策只需一次调用
+        self._decide = self.strategy.decide
 
-    def make_decision(self, game_state: Dict[str, Any]) -> Tuple[Action, int]:
+    def make_decision(self, game_state: GameState) -> Tuple[Action, int]:
         """
         AI玩家做出决策
 
@@ -30,4 +33,4 @@ class AIPlayer(Player):
         Returns:
             (行动, 金额) 元组
         """
-        return self.strategy.decide(self, game_state)
\ No newline at end of file
+        return self._decide(self, game_state)
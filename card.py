@@ -1,32 +1,151 @@
+from typing import Iterable
+
+import numpy as np
+
 from rank import Rank
 from suit import Suit
 
+# 各点数对应的素数（2到A），多张牌素数之积唯一标识点数组合
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# 花色位标记（Cactus Kev 编码中的 cdhs 四位）
+SUIT_BIT_FLAGS = {
+    Suit.SPADES: 0x1,
+    Suit.HEARTS: 0x2,
+    Suit.DIAMONDS: 0x4,
+    Suit.CLUBS: 0x8,
+}
+
+_RANKS = tuple(Rank)
+_SUITS = tuple(Suit)
+_SUITS_BY_BIT = {bit: suit for suit, bit in SUIT_BIT_FLAGS.items()}
+_SUIT_INDEX_BY_BIT = {SUIT_BIT_FLAGS[suit]: int(suit) for suit in _SUITS}
+# 点数的显示字符串，10以内展示数值，其余用JQKA简写
+_RANK_STR = {rank: (str(int(rank)) if rank <= 10 else rank.name[0]) for rank in _RANKS}
+
+
+def make_card(rank: Rank, suit: Suit) -> "Card":
+    """
+    按 Cactus Kev 方式把一张牌编码为整数
+
+    编码布局（32位）: xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp
+        b: 点数位（每个点数占一位）
+        cdhs: 花色位
+        r: 点数序号（0-12）
+        p: 点数素数
+
+    Args:
+        rank: 牌的点数
+        suit: 牌的花色
+
+    Returns:
+        编码后的扑克牌
+    """
+    rank_idx = rank - 2
+    code = ((1 << (rank_idx + 16)) | (SUIT_BIT_FLAGS[suit] << 12) |
+            (rank_idx << 8) | RANK_PRIMES[rank_idx])
+    return int.__new__(Card, code)
+
+
+def card_from_id(card_id: int) -> "Card":
+    """
+    由牌编号（点数序号*4+花色序号，0-51）得到扑克牌
+
+    Args:
+        card_id: 牌编号
+
+    Returns:
+        对应的扑克牌
+    """
+    return CARDS[card_id]
+
+
+def card_id(card: int) -> int:
+    """返回编码牌对应的牌编号（0-51）"""
+    return ((card >> 8) & 0xF) * 4 + _SUIT_INDEX_BY_BIT[(card >> 12) & 0xF]
+
+
+def cards_to_u8(cards: Iterable[int]) -> np.ndarray:
+    """
+    把一组牌打包为uint8数组，每个元素为 点数<<2 | 花色序号
+
+    Args:
+        cards: 扑克牌列表
+
+    Returns:
+        打包后的数组，点数 = 元素>>2，花色 = 元素&3
+    """
+    return np.fromiter((_U8_BY_CARD[card] for card in cards), dtype=np.uint8)
 
-class Card:
-    """扑克牌类"""
 
-    def __init__(self, rank: Rank, suit: Suit):
+def card_rank(card: int) -> int:
+    """直接从编码位取出牌的点数（2-14），不经过Rank枚举"""
+    return ((card >> 8) & 0xF) + 2
+
+
+def same_suit(card1: int, card2: int) -> bool:
+    """两张编码牌是否同花（花色位相同）"""
+    return (card1 & card2 & 0xF000) != 0
+
+
+def card_mask(cards: Iterable[int]) -> int:
+    """
+    把一组牌表示为52位整数掩码（第i位对应牌编号i），与牌的顺序无关
+
+    Args:
+        cards: 扑克牌列表
+
+    Returns:
+        牌集合的位掩码
+    """
+    mask = 0
+    for card in cards:
+        mask |= _BIT_BY_CARD[card]
+    return mask
+
+
+def card_repr(card: int) -> str:
+    """返回编码牌的字符串表示,展示数值或者JQKA简写"""
+    return _CARD_STR[card]
+
+
+class Card(int):
+    """扑克牌类，本身就是一个 Cactus Kev 编码的整数，相等比较和哈希均为原生整数运算"""
+
+    # 不为实例创建__dict__，牌对象与普通整数一样紧凑
+    __slots__ = ()
+
+    def __new__(cls, rank: Rank, suit: Suit):
         """
-        初始化扑克牌
+        获取扑克牌
+
+        返回CARDS中共享的牌对象，同一张牌总是同一个对象，
+        集合和字典查找时可以直接命中身份比较
 
         Args:
             rank: 牌的点数
             suit: 牌的花色
         """
-        self.rank = rank
-        self.suit = suit
-
-    def __repr__(self):
-        """返回牌的字符串表示,展示数值或者JQKA简写"""
-        if  self.rank.value <= 10:
-            rank_str = str(self.rank.value)
-        else:
-            rank_str = self.rank.name[0]
-        return f"{rank_str}{self.suit.value}"
-    def __eq__(self, other):
-        """判断两张牌是否相等"""
-        return self.rank == other.rank and self.suit == other.suit
-
-    def __hash__(self):
-        """返回牌的哈希值，用于在集合和字典中使用"""
-        return hash((self.rank, self.suit))
\ No newline at end of file
+        return CARDS[(rank - 2) * 4 + suit]
+
+    @property
+    def rank(self) -> Rank:
+        """牌的点数"""
+        return _RANKS[(self >> 8) & 0xF]
+
+    @property
+    def suit(self) -> Suit:
+        """牌的花色"""
+        return _SUITS_BY_BIT[(self >> 12) & 0xF]
+
+    __repr__ = card_repr
+
+
+# 按牌编号排列的52张牌，在导入时构建一次，之后所有牌对象都从这里共享
+CARDS = tuple(make_card(rank, suit) for rank in _RANKS for suit in _SUITS)
+# 每张牌的字符串表示，打印时直接查表
+_CARD_STR = {card: f"{_RANK_STR[card.rank]}{card.suit.symbol}" for card in CARDS}
+# 每张牌打包后的uint8编码（点数<<2 | 花色序号）
+_U8_BY_CARD = {card: (int(card.rank) << 2) | int(card.suit) for card in CARDS}
+# 每张牌在52位掩码中对应的位
+_BIT_BY_CARD = {card: 1 << card_id(card) for card in CARDS}
@@ -1,21 +1,57 @@
-import random
+from typing import List, Union
 
-from card import Card
-from rank import Rank
-from suit import Suit
+import numpy as np
+
+from card import Card, CARDS
+
+# 一副完整牌的牌编号（点数序号*4+花色序号）
+_FULL_DECK = np.arange(52, dtype=np.uint8)
+# 一副完整牌的52位掩码（第i位对应牌编号i，与card.card_mask一致）
+FULL_MASK = (1 << 52) - 1
+
+
+def remaining_cards(dead_mask: int) -> np.ndarray:
+    """
+    返回不在掩码中的牌编号
+
+    去掉已知牌只需一次位运算，再把剩余的位展开为升序的牌编号数组
+
+    Args:
+        dead_mask: 已知牌（手牌、公共牌等）的52位掩码
+
+    Returns:
+        剩余牌的牌编号数组（uint8，升序）
+    """
+    live = FULL_MASK & ~dead_mask
+    bits = np.unpackbits(np.frombuffer(live.to_bytes(7, "little"), dtype=np.uint8), bitorder="little")
+    return np.flatnonzero(bits).astype(np.uint8)
 
 
 class Deck:
     """牌堆类，负责管理一副扑克牌"""
 
-    def __init__(self):
-        """初始化一副完整的52张扑克牌"""
-        self.cards = [Card(rank, suit) for rank in Rank for suit in Suit]
+    def __init__(self, seed: Union[int, np.random.Generator, None] = None):
+        """
+        初始化一副完整的52张扑克牌
+
+        Args:
+            seed: 随机数种子（PCG64），为None时从系统熵源获取，指定时洗牌和抽样可复现；
+                也可以直接传入随机数生成器（如spawn_rngs派生的生成器），牌堆使用该生成器
+        """
+        self.cards = _FULL_DECK.copy()
+        self._rng = np.random.default_rng(seed)
+        # 牌堆顶部位置，cards[:_top]为剩余的牌
+        self._top = 52
+        self.shuffle()
+
+    def reset(self):
+        """收回所有牌并重新洗牌，复用同一个牌堆数组"""
+        self._top = 52
         self.shuffle()
 
     def shuffle(self):
-        """洗牌"""
-        random.shuffle(self.cards)
+        """洗牌（原地打乱剩余的牌）"""
+        self._rng.shuffle(self.cards[:self._top])
 
     def deal(self) -> Card:
         """
@@ -24,8 +60,56 @@ class Deck:
         Returns:
             发出的牌，如果牌堆为空则返回None
         """
-        return self.cards.pop() if self.cards else None
+        if self._top == 0:
+            return None
+        self._top -= 1
+        return CARDS[self.cards[self._top]]
+
+    def deal_many(self, n: int) -> np.ndarray:
+        """
+        从牌堆顶部一次发出多张牌
+
+        Args:
+            n: 发牌数量
+
+        Returns:
+            发出牌的牌编号数组（牌堆数组的视图，不复制）
+        """
+        n = min(n, self._top)
+        self._top -= n
+        return self.cards[self._top:self._top + n]
+
+    def sample_runouts(self, k: int, n: int, dead_mask: int) -> np.ndarray:
+        """
+        一次性随机抽取n组互不重复的k张牌（用于蒙特卡洛模拟）
+
+        Args:
+            k: 每组抽取的牌数
+            n: 抽取组数
+            dead_mask: 已知牌（手牌、公共牌等）的52位掩码，这些牌不参与抽取
+
+        Returns:
+            形状为(n, k)的牌编号数组，每行内的牌互不相同
+        """
+        remaining = remaining_cards(dead_mask)
+        if k <= 0:
+            return np.empty((n, 0), dtype=np.uint8)
+        # 对每行的随机键做部分排序，取最小的k个位置即为不重复的随机抽样
+        idx = self._rng.random((n, remaining.size)).argpartition(k - 1, axis=1)[:, :k]
+        return remaining[idx]
+
+    def spawn_rngs(self, n: int) -> List[np.random.Generator]:
+        """
+        派生n个相互独立的随机数生成器（用于多线程/多进程并行模拟）
+
+        Args:
+            n: 生成器数量
+
+        Returns:
+            独立随机流的生成器列表
+        """
+        return self._rng.spawn(n)
 
     def __len__(self):
         """返回牌堆中剩余的牌数"""
-        return len(self.cards)
+        return self._top
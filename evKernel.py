@@ -0,0 +1,49 @@
+"""蒙特卡洛GTO策略的期望价值计算内核（安装了numba时编译为本地代码）"""
+
+import numpy as np
+
+from jit import njit
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def compute_evs(hand_strength: float, position_advantage: float, pot: float, call_amount: float,
+                raise_amount: float, chips: float, fe_r: float = 0.3, fe_a: float = 0.4) -> np.ndarray:
+    """
+    计算所有行动的期望价值
+
+    Args:
+        hand_strength: 手牌强度（摊牌胜率）
+        position_advantage: 位置优势
+        pot: 底池大小
+        call_amount: 跟注所需金额
+        raise_amount: 加注金额
+        chips: 玩家剩余筹码（全下金额）
+        fe_r: 加注时对手弃牌的概率
+        fe_a: 全下时对手弃牌的概率
+
+    Returns:
+        长度为5的数组，依次为(弃牌, 过牌, 跟注, 加注, 全下)期望价值
+    """
+    lose = 1.0 - hand_strength
+    evs = np.empty(5)
+
+    # 弃牌EV为0
+    evs[0] = 0.0
+
+    # 过牌：基于手牌强度和位置计算
+    evs[1] = hand_strength * position_advantage * pot * 0.1
+
+    # 跟注：无需跟注时等同于过牌
+    if call_amount <= 0:
+        evs[2] = evs[1]
+    else:
+        evs[2] = hand_strength * pot - lose * call_amount
+
+    # 加注/全下：对手按给定概率弃牌，否则摊牌
+    evs[3] = fe_r * pot + (1.0 - fe_r) * (hand_strength * (pot + raise_amount) - lose * raise_amount)
+    evs[4] = fe_a * pot + (1.0 - fe_a) * (hand_strength * (pot + chips) - lose * chips)
+    return evs
+
+
+# 导入时先编译一次，避免第一次决策时的编译延迟
+compute_evs(0.5, 1.0, 1.0, 1.0, 1.0, 1.0)
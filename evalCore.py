@@ -0,0 +1,82 @@
+"""Cactus Kev 7张牌评估内核（安装了numba时编译为本地代码）"""
+
+from itertools import combinations
+
+import numpy as np
+
+from jit import njit
+
+# 手牌等级数（1为皇家同花顺，7462为最小的高牌）
+WORST_RANK = 7462
+
+# 从5/6/7张牌中选5张的下标组合表，形状分别为(1, 5)、(6, 5)和(21, 5)
+# 全局数组在numba编译时作为常量嵌入内核
+COMBOS_5C5 = np.array(list(combinations(range(5), 5)), dtype=np.int8)
+COMBOS_6C5 = np.array(list(combinations(range(6), 5)), dtype=np.int8)
+COMBOS_7C5 = np.array(list(combinations(range(7), 5)), dtype=np.int8)
+
+
+@njit(cache=True, nogil=True)
+def _eval5(c1: int, c2: int, c3: int, c4: int, c5: int, flush_table: np.ndarray,
+           unsuited_keys: np.ndarray, unsuited_values: np.ndarray) -> int:
+    """评估5张编码牌，返回等级编号（越小越强）"""
+    # 5张牌的花色位全部相同即为同花
+    if c1 & c2 & c3 & c4 & c5 & 0xF000:
+        return flush_table[(c1 | c2 | c3 | c4 | c5) >> 16]
+    product = (np.int64(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) *
+               (c4 & 0xFF) * (c5 & 0xFF))
+    return unsuited_values[np.searchsorted(unsuited_keys, product)]
+
+
+@njit(cache=True, nogil=True)
+def eval7(cards: np.ndarray, flush_table: np.ndarray,
+          unsuited_keys: np.ndarray, unsuited_values: np.ndarray) -> int:
+    """
+    评估5-7张编码牌
+
+    Args:
+        cards: Cactus Kev编码牌的int32数组（5-7张）
+        flush_table: 同花等级表，下标为13位点数掩码
+        unsuited_keys: 非同花点数素数之积，升序排列
+        unsuited_values: 与unsuited_keys对应的等级
+
+    Returns:
+        所有5张组合中最好的等级编号（越小越强）
+    """
+    n = cards.shape[0]
+    if n == 7:
+        combos = COMBOS_7C5
+    elif n == 6:
+        combos = COMBOS_6C5
+    else:
+        combos = COMBOS_5C5
+
+    best = WORST_RANK
+    for i in range(combos.shape[0]):
+        combo = combos[i]
+        rank = _eval5(cards[combo[0]], cards[combo[1]], cards[combo[2]], cards[combo[3]], cards[combo[4]],
+                      flush_table, unsuited_keys, unsuited_values)
+        if rank < best:
+            best = rank
+    return best
+
+
+@njit(cache=True, nogil=True)
+def eval7_batch(hands: np.ndarray, flush_table: np.ndarray,
+                unsuited_keys: np.ndarray, unsuited_values: np.ndarray) -> np.ndarray:
+    """
+    批量评估多手牌
+
+    Args:
+        hands: 形状为(N, m)的Cactus Kev编码牌int32数组，每行一手牌（5-7张）
+        flush_table: 同花等级表
+        unsuited_keys: 非同花点数素数之积（升序）
+        unsuited_values: 与unsuited_keys对应的等级
+
+    Returns:
+        形状为(N,)的等级编号数组（越小越强）
+    """
+    ranks = np.empty(hands.shape[0], dtype=np.int32)
+    for i in range(hands.shape[0]):
+        ranks[i] = eval7(hands[i], flush_table, unsuited_keys, unsuited_values)
+    return ranks
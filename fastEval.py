@@ -0,0 +1,59 @@
+"""基于TwoPlusTwo状态机查找表（HandRanks.dat）的快速手牌评估"""
+
+import os
+from typing import List
+
+import numpy as np
+
+from card import Card, card_id
+
+# 查找表文件路径（由TwoPlusTwoHandEvaluator生成，约123MB，不随仓库提供）
+HAND_RANKS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "HandRanks.dat")
+
+# 查找表以内存映射方式打开，只有被访问到的页才会读入内存
+_TABLE = np.memmap(HAND_RANKS_PATH, dtype=np.int32, mode="r") if os.path.exists(HAND_RANKS_PATH) else None
+
+# 查找表是否可用，不可用时调用方应回退到HandEvaluator
+USE_LUT = _TABLE is not None
+
+# 同花顺在查找表中的牌型编号，以及皇家同花顺在同花顺内的序号
+_STRAIGHT_FLUSH = 9
+_ROYAL_FLUSH_INDEX = 10
+
+
+def evaluate(cards: List[Card]) -> int:
+    """
+    查表评估5-7张牌
+
+    Args:
+        cards: 要评估的牌列表（5-7张）
+
+    Returns:
+        查找表中的等价类值，数值越大手牌越强；高位(>>12)为牌型，低12位为牌型内的序号
+    """
+    table = _TABLE
+    # 查找表的牌编号从1开始
+    p = 53
+    for card in cards:
+        p = int(table[p + card_id(card) + 1])
+    # 不足7张时还需要再查一次才能得到最终结果
+    if len(cards) < 7:
+        p = int(table[p])
+    return p
+
+
+def hand_category(cards: List[Card]) -> int:
+    """
+    查表得到手牌等级
+
+    Args:
+        cards: 要评估的牌列表（5-7张）
+
+    Returns:
+        与HandEvaluator.rank_category相同的牌型: 9=皇家同花顺, 8=同花顺, ..., 0=高牌
+    """
+    value = evaluate(cards)
+    category = value >> 12
+    if category == _STRAIGHT_FLUSH and value & 0xFFF == _ROYAL_FLUSH_INDEX:
+        return 9
+    return category - 1
@@ -1,5 +1,11 @@
-from typing import List
+import contextlib
+import io
+import sys
+from typing import Dict, List
 
+import numpy as np
+
+from deck import Deck
 from humanPlayer import HumanPlayer
 from player import Player
 from texasHoldem import TexasHoldem
@@ -8,24 +14,63 @@ from texasHoldem import TexasHoldem
 class GameManager:
     """游戏管理器，负责管理多局游戏和玩家"""
 
-    def __init__(self, initial_players: List[Player] = None):
+    def __init__(self, initial_players: List[Player] = None, verbose: bool = True):
         """
         初始化游戏管理器
 
         Args:
             initial_players: 初始玩家列表
+            verbose: 没有真人玩家时是否输出每手牌的过程（为False时只输出最终结果）
         """
         self.players = initial_players or []
+        self.verbose = verbose
+        # 玩家名称到其在players中下标（升序，允许重名）的索引
+        self._name_idx: Dict[str, List[int]] = {}
+        for i, player in enumerate(self.players):
+            self._name_idx.setdefault(player.name, []).append(i)
+        # 按座位存放的热点字段（结构数组），在每手牌结束时同步
+        self._chips = np.zeros(0, dtype=np.int64)
+        self._is_human = np.zeros(0, dtype=bool)
         self.game = None
         self.hands_played = 0
 
     def add_player(self, player: Player):
         """添加玩家"""
+        self._name_idx.setdefault(player.name, []).append(len(self.players))
         self.players.append(player)
 
     def remove_player(self, player_name: str):
-        """移除玩家"""
-        self.players = [p for p in self.players if p.name != player_name]
+        """
+        移除所有同名玩家
+
+        原地删除，其余玩家的座位顺序不变，只重建被删除座位之后的玩家的索引；
+        游戏进行中时庄家位置随之前移，仍指向同一名玩家
+
+        Args:
+            player_name: 要移除的玩家名称
+        """
+        seats = self._name_idx.pop(player_name, None)
+        if not seats:
+            return
+        for i in reversed(seats):
+            del self.players[i]
+
+        if self.game is not None and self.players:
+            dealer = self.game.dealer_position - sum(1 for i in seats if i < self.game.dealer_position)
+            self.game.dealer_position = dealer % len(self.players)
+
+        # 被删除的第一个座位之后的玩家下标都发生了变化
+        first = seats[0]
+        later = self.players[first:]
+        for name in {player.name for player in later}:
+            self._name_idx[name] = [i for i in self._name_idx[name] if i < first]
+        for i, player in enumerate(later, first):
+            self._name_idx[player.name].append(i)
+
+    def _sync_seat_arrays(self):
+        """从玩家对象同步筹码数组"""
+        self._chips = np.fromiter((player.chips for player in self.players), dtype=np.int64,
+                                  count=len(self.players))
 
     def start_game(self, small_blind: int = 10, big_blind: int = 20, max_hands: int = 100):
         """
@@ -40,38 +85,39 @@ class GameManager:
             print("Need at least 2 players to start the game")
             return
 
-        self.game = TexasHoldem(self.players, small_blind, big_blind)
+        self.game = TexasHoldem(self.players, small_blind, big_blind, Deck())
 
         print("Starting Texas Hold'em Game!")
         print(f"Players: {', '.join(player.name for player in self.players)}")
         print(f"Blinds: ${small_blind}/${big_blind}")
         print(f"Maximum hands: {max_hands}")
 
+        # 玩家组成在游戏过程中不变，只需判断一次是否有真人玩家
+        self._is_human = np.array([isinstance(player, HumanPlayer) for player in self.players], dtype=bool)
+        has_human = bool(self._is_human.any())
+
+        # 没有真人玩家时把每手牌的输出先写入缓冲区，每手牌结束后一次写出
+        hand_log = None if has_human else io.StringIO()
+
         for hand_num in range(1, max_hands + 1):
-            print(f"\n" * 5)
-            print(f"\n{'=' * 50}")
-            print(f"Hand #{hand_num}")
-            print(f"{'=' * 50}")
-
-            self.game.start_hand()
-            self.hands_played += 1
-
-            # 显示玩家筹码和当前手牌
-            print("\nPlayer chips and hands played:")
-            for player in self.players:
-                if player.folded == True:
-                    print(f"  {player.name}: ${player.chips}")
-
-                else:
-                    print(f"  {player.name}: ${player.chips} {player.hand}")
+            if hand_log is None:
+                self._play_hand(hand_num)
+            else:
+                with contextlib.redirect_stdout(hand_log):
+                    self._play_hand(hand_num)
+                if self.verbose:
+                    sys.stdout.write(hand_log.getvalue())
+                hand_log.seek(0)
+                hand_log.truncate()
+
             # 检查是否有玩家出局
-            active_players = [p for p in self.players if p.chips > 0]
-            if len(active_players) < 2:
-                print(f"\nGame over! Only {len(active_players)} player(s) remaining.")
+            active_count = int((self._chips > 0).sum())
+            if active_count < 2:
+                print(f"\nGame over! Only {active_count} player(s) remaining.")
                 break
 
             # 询问是否继续（如果有真人玩家）
-            if any(isinstance(player, HumanPlayer) for player in self.players):
+            if has_human:
                 continue_input = input("\nPress Enter to continue or 'q' to quit: ").strip().lower()
                 if continue_input == 'q':
                     break
@@ -79,14 +125,35 @@ class GameManager:
         # 显示最终结果
         self._display_final_results()
 
+    def _play_hand(self, hand_num: int):
+        """进行一手牌并显示玩家筹码"""
+        sys.stdout.write("\n" * 6 + f"\n{'=' * 50}\nHand #{hand_num}\n{'=' * 50}\n")
+
+        self.game.start_hand()
+        self.hands_played += 1
+
+        self._sync_seat_arrays()
+
+        # 显示玩家筹码和当前手牌，整块内容一次写出
+        lines = ["\nPlayer chips and hands played:\n"]
+        for player in self.players:
+            if player.folded == True:
+                lines.append(f"  {player.name}: ${player.chips}\n")
+
+            else:
+                lines.append(f"  {player.name}: ${player.chips} {player.hand}\n")
+        sys.stdout.write("".join(lines))
+
     def _display_final_results(self):
         """显示最终结果"""
         print(f"\n{'=' * 50}")
         print("FINAL RESULTS")
         print(f"{'=' * 50}")
 
-        # 按筹码排序
-        sorted_players = sorted(self.players, key=lambda p: p.chips, reverse=True)
+        # 按筹码排序（稳定排序，筹码相同时保持座位顺序）
+        self._sync_seat_arrays()
+        order = np.argsort(-self._chips, kind='stable')
+        sorted_players = [self.players[i] for i in order]
 
         for i, player in enumerate(sorted_players, 1):
             print(f"{i}. {player.name}: ${player.chips}")
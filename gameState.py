@@ -0,0 +1,35 @@
+from typing import List, Tuple
+
+from card import Card
+
+
+class GameState:
+    """
+    玩家决策时看到的游戏状态
+
+    每轮下注只创建一次，行动后由牌局原地更新，所有玩家共享同一个对象；
+    使用__slots__存储字段，属性访问无需哈希查找
+    """
+
+    __slots__ = ("community_cards", "current_bet", "min_raise", "pot", "players")
+
+    def __init__(self, community_cards: List[Card], current_bet: int, min_raise: int, pot: int,
+                 players: Tuple = ()):
+        """
+        Args:
+            community_cards: 公共牌
+            current_bet: 当前轮的最高下注额
+            min_raise: 最小加注额
+            pot: 底池大小
+            players: 桌上的玩家（可选，用于计算位置）
+        """
+        self.community_cards = community_cards
+        self.current_bet = current_bet
+        self.min_raise = min_raise
+        self.pot = pot
+        self.players = players
+
+    def __repr__(self):
+        """返回游戏状态的字符串表示"""
+        return (f"GameState(community_cards={self.community_cards}, current_bet={self.current_bet}, "
+                f"min_raise={self.min_raise}, pot={self.pot})")
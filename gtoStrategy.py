@@ -1,16 +1,50 @@
-import random
-import math
+import os
 import numpy as np
-from typing import List, Tuple, Dict, Any, Set
-from collections import defaultdict
+from typing import List, Tuple, Dict, Set
+from functools import cached_property
 
 from action import Action
-from card import Card
+from card import Card, card_rank, cards_to_u8, same_suit
+from deck import Deck
+from evKernel import compute_evs
+from fastEval import USE_LUT, hand_category
+from gameState import GameState
 from handEvaluator import HandEvaluator
 from player import Player
+from preflopEquity import canonical_index
+from stage import Stage
 from strategy import PokerStrategy
 
 
+# GTO范围图表文件路径（不随仓库提供，不存在时范围图表为空）
+RANGE_CHART_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ranges.npz")
+
+# 各点数对应的位（1 << 点数）
+_RANK_BITS = np.left_shift(1, np.arange(16, dtype=np.int64))
+
+# 各阶段对GTO手牌强度的放大系数，按Stage排列: 翻牌前, 翻牌圈, 转牌圈, 河牌圈
+_STAGE_STRENGTH_MULTIPLIER = (1.0, 1.2, 1.5, 2.0)
+
+# 各阶段对隐含赔率的放大系数，按Stage排列
+_STAGE_IMPLIED_ODDS_MULTIPLIER = (
+    3.0,  # 翻牌前隐含赔率最高
+    2.0,  # 翻牌圈
+    1.5,  # 转牌圈
+    1.0  # 河牌圈没有隐含赔率
+)
+
+# 每次决策预先抽取的均匀随机数个数（一次决策最多使用2个）
+_DRAW_BATCH = 16
+
+# 各阶段决策分数的权重（每行对应一个Stage）: 手牌强度, 范围优势, 位置, 底池赔率, 隐含赔率
+_SCORE_WEIGHTS = np.array([
+    [0.3, 0.3, 0.2, 0.1, 0.1],
+    [0.4, 0.2, 0.2, 0.1, 0.1],
+    [0.5, 0.2, 0.1, 0.1, 0.1],
+    [0.6, 0.2, 0.1, 0.1, 0.0]  # 河牌圈没有隐含赔率
+])
+
+
 class GTOStrategy(PokerStrategy):
     """GTO (Game Theory Optimal) 策略实现"""
 
@@ -24,9 +58,20 @@ class GTOStrategy(PokerStrategy):
         self.complexity = complexity
         self.hand_ranges = self._initialize_hand_ranges()
         self.position_weights = self._initialize_position_weights()
-        self.range_charts = self._initialize_range_charts()
-
-    def decide(self, player: Player, game_state: Dict[str, Any]) -> Tuple[Action, int]:
+        # 起手牌相关的查表数据，下标为(点数1, 点数2, 是否同花)
+        self._preflop_strength, self._preflop_playability = self._initialize_preflop_tables()
+        # 169种规范起手牌的范围强度，下标由canonical_index给出
+        self._range_strength = self._build_169_table()
+        # 混合策略使用的随机数生成器，每次决策开始时批量抽取一组均匀随机数
+        self._rng = np.random.default_rng()
+        self._draws: List[float] = []
+        self._draw_i = 0
+        # 单次决策内的计算缓存，键为(id(手牌), 公共牌张数, 阶段)，每次决策开始时清空
+        self._play_cache: Dict[Tuple[int, int, Stage], float] = {}
+        self._strength_cache: Dict[Tuple[int, int, Stage], float] = {}
+        self._raw_strength_cache: Dict[Tuple[int, int], float] = {}
+
+    def decide(self, player: Player, game_state: GameState) -> Tuple[Action, int]:
         """
         使用GTO策略做出决策
 
@@ -37,11 +82,14 @@ class GTOStrategy(PokerStrategy):
         Returns:
             (行动, 金额) 元组
         """
+        self._clear_decision_cache()
+        self._refill_draws()
+
         # 获取游戏阶段
-        game_stage = self._get_game_stage(game_state['community_cards'])
+        game_stage = self._get_game_stage(game_state.community_cards)
 
         # 计算手牌强度
-        hand_strength = self._calculate_gto_hand_strength(player.hand, game_state['community_cards'], game_stage)
+        hand_strength = self._calculate_gto_hand_strength(player.hand, game_state.community_cards, game_stage)
 
         # 计算范围优势
         range_advantage = self._calculate_range_advantage(player.hand, game_stage)
@@ -65,34 +113,17 @@ class GTOStrategy(PokerStrategy):
 
     def _initialize_hand_ranges(self) -> Dict[str, Set[Tuple[int, int, bool]]]:
         """初始化手牌范围表"""
-        ranges = {
-            # 翻牌前范围
-            "UTG": set(), "MP": set(), "CO": set(), "BTN": set(), "SB": set(), "BB": set(),
-            # 翻牌后范围
-            "value_hands": set(), "bluff_hands": set(), "medium_hands": set()
-        }
+        # 生成所有可能的手牌组合 (rank1, rank2, suited)，rank1 >= rank2 避免重复
+        all_hands = frozenset((r1, r2, suited)
+                              for r1 in range(2, 15)
+                              for r2 in range(2, r1 + 1)
+                              for suited in (True, False))
 
-        # 生成所有可能的手牌组合 (rank1, rank2, suited)
-        ranks = list(range(2, 15))  # 2到A
-        for r1 in ranks:
-            for r2 in ranks:
-                if r1 >= r2:  # 避免重复
-                    suited = True
-                    ranges["UTG"].add((r1, r2, suited))
-                    ranges["MP"].add((r1, r2, suited))
-                    ranges["CO"].add((r1, r2, suited))
-                    ranges["BTN"].add((r1, r2, suited))
-                    ranges["SB"].add((r1, r2, suited))
-                    ranges["BB"].add((r1, r2, suited))
-
-                    # 非同花版本
-                    suited = False
-                    ranges["UTG"].add((r1, r2, suited))
-                    ranges["MP"].add((r1, r2, suited))
-                    ranges["CO"].add((r1, r2, suited))
-                    ranges["BTN"].add((r1, r2, suited))
-                    ranges["SB"].add((r1, r2, suited))
-                    ranges["BB"].add((r1, r2, suited))
+        # 翻牌前各位置的范围相同，共用同一个不可变集合
+        ranges = {position: all_hands for position in ("UTG", "MP", "CO", "BTN", "SB", "BB")}
+
+        # 翻牌后范围
+        ranges.update({"value_hands": set(), "bluff_hands": set(), "medium_hands": set()})
 
         return ranges
 
@@ -107,41 +138,170 @@ class GTOStrategy(PokerStrategy):
             "BB": 0.7  # 大盲位
         }
 
-    def _initialize_range_charts(self) -> Dict[str, Dict[str, List[Tuple[int, int, bool]]]]:
-        """初始化GTO范围图表"""
-        charts = {
-            "preflop": {
-                "UTG": [], "MP": [], "CO": [], "BTN": [], "SB": [], "BB": []
-            },
-            "flop": {
-                "value_bet": [], "check_raise": [], "bluff": [], "check_call": [], "check_fold": []
-            },
-            "turn": {
-                "value_bet": [], "check_raise": [], "bluff": [], "check_call": [], "check_fold": []
-            },
-            "river": {
-                "value_bet": [], "check_raise": [], "bluff": [], "check_call": [], "check_fold": []
-            }
-        }
+    @cached_property
+    def range_charts(self) -> Dict[str, np.ndarray]:
+        """
+        GTO范围图表（名称到数组的字典），第一次访问时从RANGE_CHART_PATH一次性读入
+
+        .npz归档不支持内存映射，读取后立即关闭文件；文件不存在时为空字典
+        """
+        if not os.path.exists(RANGE_CHART_PATH):
+            return {}
+        with np.load(RANGE_CHART_PATH) as charts:
+            return {name: charts[name] for name in charts.files}
+
+    def _initialize_preflop_tables(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        预先计算所有起手牌组合的原始强度和可玩性
+
+        Returns:
+            (原始强度, 可玩性) 两张形状为(15, 15, 2)的表
+        """
+        strength = np.zeros((15, 15, 2))
+        playability = np.zeros((15, 15, 2))
+
+        for r1 in range(2, 15):
+            for r2 in range(2, 15):
+                for suited in (False, True):
+                    idx = (r1, r2, int(suited))
+                    strength[idx] = self._preflop_strength_formula(r1, r2, suited)
+                    playability[idx] = self._preflop_playability_formula(r1, r2, suited)
+
+        return strength, playability
+
+    def _build_169_table(self) -> np.ndarray:
+        """
+        预先计算169种规范起手牌（13种对子、78种同花、78种不同花）的范围强度
+
+        Returns:
+            长度为169的范围强度表 (0-1)
+        """
+        table = np.zeros(169)
+        for hi in range(2, 15):
+            for lo in range(2, hi + 1):
+                for suited in ((False,) if hi == lo else (False, True)):
+                    table[canonical_index(hi, lo, suited)] = self._range_advantage_formula(hi, lo, suited)
+
+        return np.clip(table, 0.0, 1.0)
+
+    @staticmethod
+    def _preflop_strength_formula(r1: int, r2: int, suited: bool) -> float:
+        """起手牌原始强度"""
+        # 对子
+        if r1 == r2:
+            pair_strength = r1 / 14.0  # 对子越大越强
+            return 0.6 + 0.4 * pair_strength
+
+        # 连牌
+        gap = abs(r1 - r2)
+        connected = gap <= 2
+
+        # 高牌
+        high_card = max(r1, r2) / 14.0
+
+        base = 0.1
+
+        # 同花加成
+        if suited:
+            base += 0.15
+
+        # 连牌加成
+        if connected:
+            if gap == 1:
+                base += 0.2
+            elif gap == 2:
+                base += 0.1
+
+        # 高牌加成
+        base += high_card * 0.3
+
+        return base
+
+    @staticmethod
+    def _preflop_playability_formula(r1: int, r2: int, suited: bool) -> float:
+        """起手牌可玩性（同花潜力与顺子潜力的平均值）"""
+        # 同花潜力
+        flush_potential = 1.0 if suited else 0.6
+
+        # 顺子潜力
+        gap = abs(r1 - r2)
+        if gap <= 3:
+            straight_potential = 1.0 - (gap * 0.2)
+        else:
+            straight_potential = 0.3
 
-        # 这里应该填充实际的范围数据
-        # 由于数据量很大，这里只做示例填充
-        # 实际应用中应该从文件或数据库加载完整的GTO范围
+        return (flush_potential + straight_potential) / 2
 
-        return charts
+    @staticmethod
+    def _range_advantage_formula(r1: int, r2: int, suited: bool) -> float:
+        """起手牌范围优势"""
+        # 基于手牌在GTO范围中的位置计算范围优势
+        hand_score = (r1 + r2) / 2.0
+
+        # 对子加成
+        if r1 == r2:
+            hand_score += 5
+
+        # 同花加成
+        if suited:
+            hand_score += 2
+
+        # 连牌加成
+        gap = abs(r1 - r2)
+        if gap <= 2:
+            hand_score += (3 - gap)
 
-    def _get_game_stage(self, community_cards: List[Card]) -> str:
+        # 归一化到0-1范围
+        max_score = 20  # 最大可能得分 (A+A同花 = 14+14+5+2 = 35，但实际最大约20)
+        return min(1.0, hand_score / max_score)
+
+    def _get_game_stage(self, community_cards: List[Card]) -> Stage:
         """获取游戏阶段"""
         if len(community_cards) == 0:
-            return "preflop"
+            return Stage.PREFLOP
         elif len(community_cards) == 3:
-            return "flop"
+            return Stage.FLOP
         elif len(community_cards) == 4:
-            return "turn"
+            return Stage.TURN
         else:
-            return "river"
+            return Stage.RIVER
 
-    def _calculate_gto_hand_strength(self, hand: List[Card], community_cards: List[Card], stage: str) -> float:
+    def _worker(self) -> "GTOStrategy":
+        """
+        返回供其他线程使用的副本
+
+        起手牌表、手牌范围等只读数据与原实例共享，
+        随机数生成器（由本实例派生）和决策内缓存各自独立，线程之间无需加锁
+        """
+        worker = super()._worker()
+        worker._rng = self._rng.spawn(1)[0]
+        worker._draws = []
+        worker._draw_i = 0
+        worker._play_cache = {}
+        worker._strength_cache = {}
+        worker._raw_strength_cache = {}
+        return worker
+
+    def _refill_draws(self):
+        """一次抽取_DRAW_BATCH个均匀随机数，供本次决策的混合策略依次使用"""
+        self._draws = self._rng.random(_DRAW_BATCH).tolist()
+        self._draw_i = 0
+
+    def _u(self) -> float:
+        """取下一个[0, 1)均匀随机数，批量用完时重新抽取"""
+        if self._draw_i >= len(self._draws):
+            self._refill_draws()
+        value = self._draws[self._draw_i]
+        self._draw_i += 1
+        return value
+
+    def _clear_decision_cache(self):
+        """清空单次决策内的计算缓存（同一手牌对象在一次决策内不变，id可以安全地作为键）"""
+        self._play_cache.clear()
+        self._strength_cache.clear()
+        self._raw_strength_cache.clear()
+
+    def _calculate_gto_hand_strength(self, hand: List[Card], community_cards: List[Card], stage: Stage) -> float:
         """
         计算GTO手牌强度
 
@@ -156,132 +316,152 @@ class GTOStrategy(PokerStrategy):
         if len(hand) < 2:
             return 0.0
 
-        # 基础手牌强度
-        base_strength = self._calculate_raw_hand_strength(hand, community_cards)
+        key = (id(hand), len(community_cards), stage)
+        cached = self._strength_cache.get(key)
+        if cached is not None:
+            return cached
 
-        # 根据阶段调整
-        stage_multiplier = {
-            "preflop": 1.0,
-            "flop": 1.2,
-            "turn": 1.5,
-            "river": 2.0
-        }
+        # 手牌特征只提取一次，供三个分项共用
+        features = self._hand_features(hand)
+
+        # 基础手牌强度
+        raw_key = (id(hand), len(community_cards))
+        base_strength = self._raw_strength_cache.get(raw_key)
+        if base_strength is None:
+            base_strength = self._raw_strength_from_features(features, hand, community_cards)
+            self._raw_strength_cache[raw_key] = base_strength
 
         # 考虑手牌可玩性
-        playability = self._calculate_hand_playability(hand, community_cards, stage)
+        playability = self._play_cache.get(key)
+        if playability is None:
+            playability = self._playability_from_features(features, hand, community_cards, stage)
+            self._play_cache[key] = playability
 
         # 考虑阻断牌效应
-        blocker_effect = self._calculate_blocker_effect(hand, stage)
+        blocker_effect = self._blocker_from_features(features)
 
         # 综合强度
-        strength = base_strength * stage_multiplier[stage] * playability * blocker_effect
+        strength = base_strength * _STAGE_STRENGTH_MULTIPLIER[stage] * playability * blocker_effect
+
+        strength = min(1.0, max(0.0, strength))
+        self._strength_cache[key] = strength
+        return strength
 
-        return min(1.0, max(0.0, strength))
+    @staticmethod
+    def _hand_features(hand: List[Card]) -> Tuple[int, int, int, int, int, bool]:
+        """
+        提取两张手牌的公共特征
+
+        Args:
+            hand: 玩家手牌（两张）
+
+        Returns:
+            (点数1, 点数2, 是否同花(0/1), 点数差, 最大点数, 是否对子) 元组
+        """
+        card1, card2 = hand
+        # 点数和花色直接由编码位得到
+        r1 = card_rank(card1)
+        r2 = card_rank(card2)
+        return r1, r2, int(same_suit(card1, card2)), abs(r1 - r2), max(r1, r2), r1 == r2
 
     def _calculate_raw_hand_strength(self, hand: List[Card], community_cards: List[Card]) -> float:
         """计算原始手牌强度"""
         if len(hand) < 2:
             return 0.0
 
-        card1, card2 = hand
-
-        # 对子
-        if card1.rank == card2.rank:
-            pair_strength = card1.rank.value / 14.0  # 对子越大越强
-            return 0.6 + 0.4 * pair_strength
-
-        # 同花
-        suited = card1.suit == card2.suit
+        key = (id(hand), len(community_cards))
+        cached = self._raw_strength_cache.get(key)
+        if cached is not None:
+            return cached
 
-        # 连牌
-        gap = abs(card1.rank.value - card2.rank.value)
-        connected = gap <= 2
+        base = self._raw_strength_from_features(self._hand_features(hand), hand, community_cards)
+        self._raw_strength_cache[key] = base
+        return base
 
-        # 高牌
-        high_card = max(card1.rank.value, card2.rank.value) / 14.0
+    def _raw_strength_from_features(self, features: Tuple[int, int, int, int, int, bool],
+                                    hand: List[Card], community_cards: List[Card]) -> float:
+        """由手牌特征计算原始手牌强度"""
+        r1, r2, suited, _, _, is_pair = features
+        base = float(self._preflop_strength[r1, r2, suited])
 
-        base = 0.1
-
-        # 同花加成
-        if suited:
-            base += 0.15
-
-        # 连牌加成
-        if connected:
-            if gap == 0:  # 对子已处理
-                pass
-            elif gap == 1:
-                base += 0.2
-            elif gap == 2:
-                base += 0.1
-
-        # 高牌加成
-        base += high_card * 0.3
+        # 对子只按起手牌计算
+        if is_pair:
+            return base
 
         # 考虑公共牌
         if community_cards:
             all_cards = hand + community_cards
-            hand_rank, kickers = HandEvaluator.evaluate_hand(all_cards)
+            if USE_LUT:
+                hand_rank = hand_category(all_cards)
+            else:
+                hand_rank = HandEvaluator.rank_category(HandEvaluator.evaluate_hand(all_cards))
             made_hand_strength = hand_rank / 9.0  # 0-1范围
             base = max(base, made_hand_strength * 0.7 + base * 0.3)
 
         return base
 
-    def _calculate_hand_playability(self, hand: List[Card], community_cards: List[Card], stage: str) -> float:
+    def _calculate_hand_playability(self, hand: List[Card], community_cards: List[Card], stage: Stage) -> float:
         """计算手牌可玩性"""
         if len(hand) < 2:
             return 0.5
 
-        card1, card2 = hand
+        key = (id(hand), len(community_cards), stage)
+        cached = self._play_cache.get(key)
+        if cached is not None:
+            return cached
 
-        # 同花潜力
-        suited = card1.suit == card2.suit
-        flush_potential = 1.0 if suited else 0.6
+        playability = self._playability_from_features(self._hand_features(hand), hand, community_cards, stage)
+        self._play_cache[key] = playability
+        return playability
 
-        # 顺子潜力
-        gap = abs(card1.rank.value - card2.rank.value)
-        if gap <= 3:
-            straight_potential = 1.0 - (gap * 0.2)
-        else:
-            straight_potential = 0.3
+    def _playability_from_features(self, features: Tuple[int, int, int, int, int, bool],
+                                   hand: List[Card], community_cards: List[Card], stage: Stage) -> float:
+        """由手牌特征计算手牌可玩性"""
+        r1, r2, suited = features[:3]
+
+        # 同花潜力与顺子潜力的平均值（查表）
+        preflop_playability = float(self._preflop_playability[r1, r2, suited])
 
         # 根据阶段调整
-        if stage == "preflop":
-            return (flush_potential + straight_potential) / 2
-        else:
-            # 在翻牌后，考虑实际的听牌
-            draw_potential = self._calculate_draw_potential(hand, community_cards)
-            return (flush_potential + straight_potential + draw_potential) / 3
+        if stage == Stage.PREFLOP:
+            return preflop_playability
+
+        # 在翻牌后，考虑实际的听牌
+        draw_potential = self._calculate_draw_potential(cards_to_u8(hand + community_cards))
+        return (preflop_playability * 2 + draw_potential) / 3
+
+    def _calculate_draw_potential(self, cards: np.ndarray) -> float:
+        """
+        计算听牌潜力
+
+        Args:
+            cards: 手牌加公共牌，cards_to_u8打包后的数组
 
-    def _calculate_draw_potential(self, hand: List[Card], community_cards: List[Card]) -> float:
-        """计算听牌潜力"""
-        if len(community_cards) < 3:
+        Returns:
+            听牌潜力 (0-1)
+        """
+        if len(cards) < 5:
             return 0.5
 
-        all_cards = hand + community_cards
+        ranks = cards >> 2
+        suits = cards & 3
+        rank_mask = int(np.bitwise_or.reduce(_RANK_BITS[ranks]))
 
         # 检查同花听牌
-        suit_count = {}
-        for card in all_cards:
-            suit_count[card.suit] = suit_count.get(card.suit, 0) + 1
-
-        flush_draw = max(suit_count.values()) == 4  # 需要一张成花
+        flush_draw = np.bincount(suits, minlength=4).max() == 4  # 需要一张成花
 
-        # 检查顺子听牌
-        ranks = sorted(set(card.rank.value for card in all_cards))
-        straight_draw = False
+        # 点数掩码右移后按位与，第i位表示从点数i起的对应点数都存在
+        m1 = rank_mask >> 1
+        m2 = rank_mask >> 2
+        m3 = rank_mask >> 3
+        m4 = rank_mask >> 4
 
-        for i in range(len(ranks) - 3):
-            if ranks[i + 3] - ranks[i] <= 4:
-                straight_draw = True
-                break
+        # 检查顺子听牌：某个连续5个点数的窗口内至少有4个点数（4连张或中间缺一张）
+        straight_draw = (rank_mask & m1 & m2 & m3 | rank_mask & m2 & m3 & m4 |
+                         rank_mask & m1 & m3 & m4 | rank_mask & m1 & m2 & m4) != 0
 
-        # 检查两头顺听牌
-        open_ended = False
-        for i in range(len(ranks) - 4):
-            if ranks[i + 4] - ranks[i] == 4:
-                open_ended = True
-                break
+        # 检查两头顺听牌：存在5个连续点数
+        open_ended = (rank_mask & m1 & m2 & m3 & m4) != 0
 
         if flush_draw and open_ended:
             return 0.9
@@ -292,115 +472,100 @@ class GTOStrategy(PokerStrategy):
         else:
             return 0.3
 
-    def _calculate_blocker_effect(self, hand: List[Card], stage: str) -> float:
+    def _calculate_blocker_effect(self, hand: List[Card], stage: Stage) -> float:
         """计算阻断牌效应"""
         if len(hand) < 2:
             return 1.0
 
-        card1, card2 = hand
+        return self._blocker_from_features(self._hand_features(hand))
+
+    @staticmethod
+    def _blocker_from_features(features: Tuple[int, int, int, int, int, bool]) -> float:
+        """由手牌特征计算阻断牌效应"""
+        _, _, suited, _, high, is_pair = features
 
         # 高牌阻断效应 - 持有高牌会减少对手持有强牌的概率
         blocker_value = 0.0
 
         # A和K是强的阻断牌
-        if card1.rank.value >= 13 or card2.rank.value >= 13:  # K或A
+        if high >= 13:  # K或A
             blocker_value += 0.2
 
         # 对子有额外的阻断效应
-        if card1.rank == card2.rank:
+        if is_pair:
             blocker_value += 0.1
 
         # 同花阻断
-        if card1.suit == card2.suit:
+        if suited:
             blocker_value += 0.05
 
         return 1.0 + blocker_value
 
-    def _calculate_range_advantage(self, hand: List[Card], stage: str) -> float:
+    def _calculate_range_advantage(self, hand: List[Card], stage: Stage) -> float:
         """计算范围优势"""
         if len(hand) < 2:
             return 0.5
 
         card1, card2 = hand
 
-        # 基于手牌在GTO范围中的位置计算范围优势
-        hand_score = (card1.rank.value + card2.rank.value) / 2.0
-
-        # 对子加成
-        if card1.rank == card2.rank:
-            hand_score += 5
-
-        # 同花加成
-        if card1.suit == card2.suit:
-            hand_score += 2
+        # 只与起手牌有关，直接查表
+        return float(self._range_strength[canonical_index(card_rank(card1), card_rank(card2), same_suit(card1, card2))])
 
-        # 连牌加成
-        gap = abs(card1.rank.value - card2.rank.value)
-        if gap <= 2:
-            hand_score += (3 - gap)
-
-        # 归一化到0-1范围
-        max_score = 20  # 最大可能得分 (A+A同花 = 14+14+5+2 = 35，但实际最大约20)
-        advantage = min(1.0, hand_score / max_score)
-
-        return advantage
-
-    def _calculate_position_advantage(self, player: Player, game_state: Dict[str, Any]) -> float:
+    def _calculate_position_advantage(self, player: Player, game_state: GameState) -> float:
         """计算位置优势"""
         # 简化实现 - 实际应该基于确切的位置计算
         # 这里我们假设玩家在列表中的位置反映了实际位置
 
-        players = [p for p in game_state.get('players', []) if not p.folded]
-        if player not in players:
+        # 一次遍历得到未弃牌玩家数和玩家在其中的下标
+        player_index = -1
+        total_players = 0
+        for p in game_state.players:
+            if p.folded:
+                continue
+            if p is player:
+                player_index = total_players
+            total_players += 1
+
+        if player_index < 0:
             return 0.5
 
-        player_index = players.index(player)
-        total_players = len(players)
-
         # 位置越好，优势越大 (按钮位最好)
         position_advantage = (total_players - player_index) / total_players
 
         return position_advantage
 
-    def _calculate_pot_odds(self, player: Player, game_state: Dict[str, Any]) -> float:
+    def _calculate_pot_odds(self, player: Player, game_state: GameState) -> float:
         """计算底池赔率"""
-        current_bet = game_state['current_bet']
+        current_bet = game_state.current_bet
         player_current_bet = player.current_bet
         call_amount = current_bet - player_current_bet
 
         if call_amount <= 0:
             return float('inf')  # 无需跟注时赔率无限大
 
-        pot_size = game_state['pot']
+        pot_size = game_state.pot
         pot_odds = call_amount / (pot_size + call_amount)
 
         return pot_odds
 
-    def _calculate_implied_odds(self, player: Player, game_state: Dict[str, Any], stage: str) -> float:
+    def _calculate_implied_odds(self, player: Player, game_state: GameState, stage: Stage) -> float:
         """计算隐含赔率"""
         # 隐含赔率考虑未来可能赢得的额外筹码
         base_pot_odds = self._calculate_pot_odds(player, game_state)
 
         # 根据阶段调整隐含赔率
-        stage_multiplier = {
-            "preflop": 3.0,  # 翻牌前隐含赔率最高
-            "flop": 2.0,  # 翻牌圈
-            "turn": 1.5,  # 转牌圈
-            "river": 1.0  # 河牌圈没有隐含赔率
-        }
-
-        implied_odds = base_pot_odds * stage_multiplier[stage]
+        implied_odds = base_pot_odds * _STAGE_IMPLIED_ODDS_MULTIPLIER[stage]
 
         # 考虑手牌的可玩性
-        hand_playability = self._calculate_hand_playability(player.hand, game_state['community_cards'], stage)
+        hand_playability = self._calculate_hand_playability(player.hand, game_state.community_cards, stage)
         implied_odds *= (0.5 + hand_playability * 0.5)
 
         return implied_odds
 
-    def _gto_mixed_strategy(self, player: Player, game_state: Dict[str, Any],
+    def _gto_mixed_strategy(self, player: Player, game_state: GameState,
                             hand_strength: float, range_advantage: float,
                             position_advantage: float, pot_odds: float,
-                            implied_odds: float, stage: str) -> Tuple[Action, int]:
+                            implied_odds: float, stage: Stage) -> Tuple[Action, int]:
         """
         GTO混合策略决策
 
@@ -417,11 +582,11 @@ class GTOStrategy(PokerStrategy):
         Returns:
             (行动, 金额) 元组
         """
-        current_bet = game_state['current_bet']
+        current_bet = game_state.current_bet
         player_current_bet = player.current_bet
         call_amount = current_bet - player_current_bet
-        min_raise = game_state['min_raise']
-        pot_size = game_state['pot']
+        min_raise = game_state.min_raise
+        pot_size = game_state.pot
 
         # 计算综合决策分数
         decision_score = self._calculate_decision_score(
@@ -430,39 +595,25 @@ class GTOStrategy(PokerStrategy):
         )
 
         # 根据游戏阶段和情况使用不同的混合策略
-        if stage == "preflop":
+        if stage == Stage.PREFLOP:
             return self._preflop_strategy(player, game_state, decision_score, call_amount, min_raise)
         else:
             return self._postflop_strategy(player, game_state, decision_score, call_amount, min_raise, stage)
 
     def _calculate_decision_score(self, hand_strength: float, range_advantage: float,
                                   position_advantage: float, pot_odds: float,
-                                  implied_odds: float, stage: str) -> float:
+                                  implied_odds: float, stage: Stage) -> float:
         """计算综合决策分数"""
-        # 权重分配
-        weights = {
-            "preflop": [0.3, 0.3, 0.2, 0.1, 0.1],  # 手牌强度, 范围优势, 位置, 底池赔率, 隐含赔率
-            "flop": [0.4, 0.2, 0.2, 0.1, 0.1],
-            "turn": [0.5, 0.2, 0.1, 0.1, 0.1],
-            "river": [0.6, 0.2, 0.1, 0.1, 0.0]  # 河牌圈没有隐含赔率
-        }
-
-        w = weights[stage]
-
         # 归一化赔率 (赔率越低越好)
         normalized_pot_odds = 1.0 - min(1.0, pot_odds * 5)  # 假设最大赔率为0.2
         normalized_implied_odds = 1.0 - min(1.0, implied_odds * 3)  # 假设最大隐含赔率为0.33
 
         # 计算加权分数
-        score = (hand_strength * w[0] +
-                 range_advantage * w[1] +
-                 position_advantage * w[2] +
-                 normalized_pot_odds * w[3] +
-                 normalized_implied_odds * w[4])
+        features = np.array([hand_strength, range_advantage, position_advantage,
+                             normalized_pot_odds, normalized_implied_odds])
+        return float(np.dot(_SCORE_WEIGHTS[stage], features))
 
-        return score
-
-    def _preflop_strategy(self, player: Player, game_state: Dict[str, Any],
+    def _preflop_strategy(self, player: Player, game_state: GameState,
                           decision_score: float, call_amount: int, min_raise: int) -> Tuple[Action, int]:
         """翻牌前策略"""
         # 基于GTO的翻牌前范围策略
@@ -492,14 +643,12 @@ class GTOStrategy(PokerStrategy):
                 # 中等或弱牌，过牌
                 return Action.CHECK, 0
 
-    def _postflop_strategy(self, player: Player, game_state: Dict[str, Any],
+    def _postflop_strategy(self, player: Player, game_state: GameState,
                            decision_score: float, call_amount: int,
-                           min_raise: int, stage: str) -> Tuple[Action, int]:
+                           min_raise: int, stage: Stage) -> Tuple[Action, int]:
         """翻牌后策略"""
         # 基于GTO的翻牌后策略，考虑范围、阻断牌和混合策略
-
-        # 计算合适的下注尺度
-        bet_sizing = self._calculate_bet_sizing(player, game_state, decision_score, stage)
+        # 下注金额由_calculate_bet_amount等按决策分数确定，这里不需要预先抽取下注尺度
 
         if call_amount > 0:
             # 有人下注
@@ -507,7 +656,7 @@ class GTOStrategy(PokerStrategy):
                 # 超强牌，加注
                 raise_amount = self._calculate_raise_amount(player, game_state, decision_score, min_raise)
                 # 使用混合策略，有时只是跟注来平衡范围
-                if random.random() < 0.3:  # 30%概率只是跟注
+                if self._u() < 0.3:  # 30%概率只是跟注
                     if call_amount <= player.chips:
                         return Action.CALL, call_amount
                     else:
@@ -524,10 +673,10 @@ class GTOStrategy(PokerStrategy):
                 # 弱牌，弃牌
                 # 但使用混合策略，有时会用听牌跟注
                 hand_playability = self._calculate_hand_playability(
-                    player.hand, game_state['community_cards'], stage
+                    player.hand, game_state.community_cards, stage
                 )
 
-                if hand_playability > 0.7 and random.random() < 0.2:  # 20%概率用听牌跟注
+                if hand_playability > 0.7 and self._u() < 0.2:  # 20%概率用听牌跟注
                     if call_amount <= player.chips:
                         return Action.CALL, call_amount
                     else:
@@ -540,7 +689,7 @@ class GTOStrategy(PokerStrategy):
                 # 强牌，下注
                 bet_amount = self._calculate_bet_amount(player, game_state, decision_score, min_raise)
                 # 使用混合策略，有时会过牌来平衡范围
-                if random.random() < 0.2:  # 20%概率过牌
+                if self._u() < 0.2:  # 20%概率过牌
                     return Action.CHECK, 0
                 else:
                     return Action.RAISE, bet_amount
@@ -550,63 +699,27 @@ class GTOStrategy(PokerStrategy):
             else:
                 # 弱牌，过牌
                 # 但使用混合策略，有时会诈唬
-                if random.random() < 0.1:  # 10%概率诈唬
+                if self._u() < 0.1:  # 10%概率诈唬
                     bet_amount = self._calculate_bluff_bet(player, game_state, min_raise)
                     return Action.RAISE, bet_amount
                 else:
                     return Action.CHECK, 0
 
-    def _calculate_bet_sizing(self, player: Player, game_state: Dict[str, Any],
-                              decision_score: float, stage: str) -> Dict[str, float]:
-        """计算下注尺度"""
-        # GTO使用多种下注尺度来平衡策略
-        pot_size = game_state['pot']
-
-        # 不同情况下的下注尺度
-        sizes = {
-            "small": 0.33,  # 1/3底池
-            "medium": 0.66,  # 2/3底池
-            "large": 1.0,  # 满池
-            "over": 1.5  # 超池
-        }
-
-        # 根据手牌强度和阶段选择下注尺度
-        if decision_score > 0.8:
-            # 超强牌，使用混合尺度
-            if random.random() < 0.6:  # 60%概率使用中等尺度
-                return {"size": sizes["medium"], "frequency": 0.6}
-            elif random.random() < 0.8:  # 20%概率使用小尺度
-                return {"size": sizes["small"], "frequency": 0.2}
-            else:  # 20%概率使用大尺度
-                return {"size": sizes["large"], "frequency": 0.2}
-        elif decision_score > 0.6:
-            # 强牌，主要使用中小尺度
-            if random.random() < 0.7:  # 70%概率使用小尺度
-                return {"size": sizes["small"], "frequency": 0.7}
-            else:  # 30%概率使用中等尺度
-                return {"size": sizes["medium"], "frequency": 0.3}
-        else:
-            # 诈唬，使用混合尺度
-            if random.random() < 0.5:  # 50%概率使用小尺度
-                return {"size": sizes["small"], "frequency": 0.5}
-            else:  # 50%概率使用中等尺度
-                return {"size": sizes["medium"], "frequency": 0.5}
-
-    def _calculate_bet_amount(self, player: Player, game_state: Dict[str, Any],
+    def _calculate_bet_amount(self, player: Player, game_state: GameState,
                               decision_score: float, min_raise: int) -> int:
         """计算下注金额"""
-        pot_size = game_state['pot']
+        pot_size = game_state.pot
 
         # 根据决策分数选择下注尺度
         if decision_score > 0.8:
             # 超强牌，使用较大下注
-            bet_fraction = 0.75 + random.random() * 0.25  # 75%-100%底池
+            bet_fraction = 0.75 + self._u() * 0.25  # 75%-100%底池
         elif decision_score > 0.6:
             # 强牌，使用中等下注
-            bet_fraction = 0.5 + random.random() * 0.25  # 50%-75%底池
+            bet_fraction = 0.5 + self._u() * 0.25  # 50%-75%底池
         else:
             # 诈唬或中等牌力，使用较小下注
-            bet_fraction = 0.33 + random.random() * 0.17  # 33%-50%底池
+            bet_fraction = 0.33 + self._u() * 0.17  # 33%-50%底池
 
         bet_amount = int(pot_size * bet_fraction)
         bet_amount = max(min_raise, bet_amount)
@@ -614,22 +727,22 @@ class GTOStrategy(PokerStrategy):
 
         return bet_amount
 
-    def _calculate_raise_amount(self, player: Player, game_state: Dict[str, Any],
+    def _calculate_raise_amount(self, player: Player, game_state: GameState,
                                 decision_score: float, min_raise: int) -> int:
         """计算加注金额"""
-        current_bet = game_state['current_bet']
-        pot_size = game_state['pot']
+        current_bet = game_state.current_bet
+        pot_size = game_state.pot
 
         # 加注到当前下注的倍数
         if decision_score > 0.8:
             # 超强牌，较大加注
-            raise_multiple = 3.0 + random.random()  # 3-4倍
+            raise_multiple = 3.0 + self._u()  # 3-4倍
         elif decision_score > 0.6:
             # 强牌，中等加注
-            raise_multiple = 2.0 + random.random()  # 2-3倍
+            raise_multiple = 2.0 + self._u()  # 2-3倍
         else:
             # 诈唬或中等牌力，较小加注
-            raise_multiple = 1.5 + random.random() * 0.5  # 1.5-2倍
+            raise_multiple = 1.5 + self._u() * 0.5  # 1.5-2倍
 
         raise_amount = int(current_bet * raise_multiple)
         raise_amount = max(min_raise, raise_amount)
@@ -637,12 +750,12 @@ class GTOStrategy(PokerStrategy):
 
         return raise_amount
 
-    def _calculate_bluff_bet(self, player: Player, game_state: Dict[str, Any], min_raise: int) -> int:
+    def _calculate_bluff_bet(self, player: Player, game_state: GameState, min_raise: int) -> int:
         """计算诈唬下注金额"""
-        pot_size = game_state['pot']
+        pot_size = game_state.pot
 
         # 诈唬通常使用较小下注
-        bluff_fraction = 0.33 + random.random() * 0.17  # 33%-50%底池
+        bluff_fraction = 0.33 + self._u() * 0.17  # 33%-50%底池
 
         bluff_amount = int(pot_size * bluff_fraction)
         bluff_amount = max(min_raise, bluff_amount)
@@ -654,6 +767,9 @@ class GTOStrategy(PokerStrategy):
 class MonteCarloGTOStrategy(GTOStrategy):
     """使用蒙特卡洛模拟的增强GTO策略"""
 
+    # EV数组中各位置对应的行动
+    _ACTION_ORDER = (Action.FOLD, Action.CHECK, Action.CALL, Action.RAISE, Action.ALL_IN)
+
     def __init__(self, complexity: int = 3, simulations: int = 1000):
         """
         初始化蒙特卡洛GTO策略
@@ -664,123 +780,125 @@ class MonteCarloGTOStrategy(GTOStrategy):
         """
         super().__init__(complexity)
         self.simulations = simulations
+        # 只用于模拟抽牌的牌堆
+        self._mc_deck = Deck()
 
-    def decide(self, player: Player, game_state: Dict[str, Any]) -> Tuple[Action, int]:
+    def decide(self, player: Player, game_state: GameState) -> Tuple[Action, int]:
         """使用蒙特卡洛模拟增强的GTO决策"""
+        self._clear_decision_cache()
+
         # 运行蒙特卡洛模拟
-        action_ev = self._monte_carlo_simulation(player, game_state)
+        evs = self._monte_carlo_simulation(player, game_state)
 
         # 选择期望价值最高的行动
-        best_action = max(action_ev.items(), key=lambda x: x[1]['ev'])
-        action_type = best_action[0]
+        best_idx = int(evs.argmax())
+        action_type = MonteCarloGTOStrategy._ACTION_ORDER[best_idx]
 
         # 计算合适的金额
         if action_type == Action.RAISE:
-            amount = self._calculate_optimal_raise(player, game_state, action_ev[action_type])
+            amount = self._calculate_optimal_raise(player, game_state, float(evs[best_idx]))
         else:
             amount = 0
 
         return action_type, amount
 
-    def _monte_carlo_simulation(self, player: Player, game_state: Dict[str, Any]) -> Dict[Action, Dict[str, float]]:
-        """蒙特卡洛模拟计算行动期望价值"""
-        action_ev = {
-            Action.FOLD: {"ev": 0.0, "frequency": 0.0},
-            Action.CHECK: {"ev": 0.0, "frequency": 0.0},
-            Action.CALL: {"ev": 0.0, "frequency": 0.0},
-            Action.RAISE: {"ev": 0.0, "frequency": 0.0},
-            Action.ALL_IN: {"ev": 0.0, "frequency": 0.0}
-        }
+    def _worker(self) -> "MonteCarloGTOStrategy":
+        """返回供其他线程使用的副本，模拟牌堆由副本的随机数生成器播种"""
+        worker = super()._worker()
+        worker._mc_deck = Deck(int(worker._rng.integers(1 << 63)))
+        return worker
+
+    def _monte_carlo_simulation(self, player: Player, game_state: GameState) -> np.ndarray:
+        """
+        蒙特卡洛模拟计算行动期望价值
+
+        Args:
+            player: 玩家对象
+            game_state: 游戏状态
 
-        # 简化版的蒙特卡洛模拟
-        # 实际实现应该模拟剩余牌和对手可能的范围
-
-        for _ in range(self.simulations):
-            # 模拟游戏结果
-            ev_fold = self._simulate_fold(player, game_state)
-            ev_check = self._simulate_check(player, game_state)
-            ev_call = self._simulate_call(player, game_state)
-            ev_raise = self._simulate_raise(player, game_state)
-            ev_allin = self._simulate_allin(player, game_state)
-
-            action_ev[Action.FOLD]["ev"] += ev_fold
-            action_ev[Action.CHECK]["ev"] += ev_check
-            action_ev[Action.CALL]["ev"] += ev_call
-            action_ev[Action.RAISE]["ev"] += ev_raise
-            action_ev[Action.ALL_IN]["ev"] += ev_allin
-
-        # 计算平均EV
-        for action in action_ev:
-            action_ev[action]["ev"] /= self.simulations
-
-        return action_ev
-
-    def _simulate_fold(self, player: Player, game_state: Dict[str, Any]) -> float:
-        """模拟弃牌的期望价值"""
-        return 0.0  # 弃牌EV为0
-
-    def _simulate_check(self, player: Player, game_state: Dict[str, Any]) -> float:
-        """模拟过牌的期望价值"""
-        # 基于手牌强度和位置计算
-        stage = self._get_game_stage(game_state['community_cards'])
-        hand_strength = self._calculate_gto_hand_strength(player.hand, game_state['community_cards'], stage)
+        Returns:
+            按_ACTION_ORDER顺序排列的各行动期望价值
+        """
+        # 与模拟样本无关的量只计算一次
+        stage = self._get_game_stage(game_state.community_cards)
+        hand_strength = self._calculate_gto_hand_strength(player.hand, game_state.community_cards, stage)
         position_advantage = self._calculate_position_advantage(player, game_state)
+        call_amount = game_state.current_bet - player.current_bet
+        pot = game_state.pot
 
-        return hand_strength * position_advantage * game_state['pot'] * 0.1
+        # 一次性抽取所有模拟所需的随机数
+        draws = self._rng.random(size=self.simulations)
+        raise_amounts = self._sample_raise_amounts(player, game_state, hand_strength,
+                                                   game_state.min_raise, draws)
 
-    def _simulate_call(self, player: Player, game_state: Dict[str, Any]) -> float:
-        """模拟跟注的期望价值"""
-        call_amount = game_state['current_bet'] - player.current_bet
-        if call_amount <= 0:
-            return self._simulate_check(player, game_state)
+        # 用随机发出的剩余公共牌和对手手牌模拟摊牌，得到真实胜率
+        win_rate = self._simulate_showdowns(player, game_state, hand_strength)
 
-        stage = self._get_game_stage(game_state['community_cards'])
-        hand_strength = self._calculate_gto_hand_strength(player.hand, game_state['community_cards'], stage)
-        pot_odds = self._calculate_pot_odds(player, game_state)
+        # 各行动EV对加注金额是线性的，样本平均EV等于平均加注金额下的EV
+        return self._simulate_all(win_rate, position_advantage, pot, call_amount,
+                                  float(raise_amounts.mean()), player.chips)
 
-        # 简化计算
-        ev = hand_strength * game_state['pot'] - (1 - hand_strength) * call_amount
-        return ev
+    def _simulate_showdowns(self, player: Player, game_state: GameState, hand_strength: float) -> float:
+        """
+        模拟self.simulations次摊牌估计胜率
+
+        所有模拟的剩余公共牌和对手手牌一次性抽取，并批量评估
 
-    def _simulate_raise(self, player: Player, game_state: Dict[str, Any]) -> float:
-        """模拟加注的期望价值"""
-        stage = self._get_game_stage(game_state['community_cards'])
-        hand_strength = self._calculate_gto_hand_strength(player.hand, game_state['community_cards'], stage)
-        range_advantage = self._calculate_range_advantage(player.hand, stage)
+        Args:
+            player: 玩家对象
+            game_state: 游戏状态
+            hand_strength: 无法模拟（手牌不足两张）时使用的手牌强度
 
-        # 基于手牌强度和范围优势计算
-        fold_equity = 0.3  # 假设对手有30%概率弃牌
-        raise_amount = self._calculate_raise_amount(player, game_state, hand_strength, game_state['min_raise'])
+        Returns:
+            胜率 (0-1)
+        """
+        if len(player.hand) < 2:
+            return hand_strength
 
-        ev = (fold_equity * game_state['pot'] +
-              (1 - fold_equity) * (hand_strength * (game_state['pot'] + raise_amount) -
-                                   (1 - hand_strength) * raise_amount))
+        n_opponents = sum(1 for p in game_state.players if p is not player and not p.folded) or 1
+        return HandEvaluator.estimate_equity(player.hand, game_state.community_cards, self._mc_deck,
+                                             n_opponents, self.simulations)
 
-        return ev
+    def _sample_raise_amounts(self, player: Player, game_state: GameState,
+                              decision_score: float, min_raise: int, draws: np.ndarray) -> np.ndarray:
+        """按_calculate_raise_amount的规则，用给定的随机数批量计算加注金额"""
+        if decision_score > 0.8:
+            raise_multiple = 3.0 + draws  # 3-4倍
+        elif decision_score > 0.6:
+            raise_multiple = 2.0 + draws  # 2-3倍
+        else:
+            raise_multiple = 1.5 + draws * 0.5  # 1.5-2倍
 
-    def _simulate_allin(self, player: Player, game_state: Dict[str, Any]) -> float:
-        """模拟全下的期望价值"""
-        stage = self._get_game_stage(game_state['community_cards'])
-        hand_strength = self._calculate_gto_hand_strength(player.hand, game_state['community_cards'], stage)
+        raise_amounts = (game_state.current_bet * raise_multiple).astype(np.int64)
+        return np.clip(raise_amounts, min_raise, None).clip(None, player.chips)
 
-        # 全下EV计算
-        fold_equity = 0.4  # 假设对手有40%概率弃牌
-        allin_amount = player.chips
+    def _simulate_all(self, hand_strength: float, position_advantage: float, pot: int,
+                      call_amount: int, raise_amount: float, chips: int) -> np.ndarray:
+        """
+        计算所有行动的期望价值
 
-        ev = (fold_equity * game_state['pot'] +
-              (1 - fold_equity) * (hand_strength * (game_state['pot'] + allin_amount) -
-                                   (1 - hand_strength) * allin_amount))
+        Args:
+            hand_strength: 手牌强度（摊牌胜率）
+            position_advantage: 位置优势
+            pot: 底池大小
+            call_amount: 跟注所需金额
+            raise_amount: 加注金额
+            chips: 玩家剩余筹码（全下金额）
 
-        return ev
+        Returns:
+            按_ACTION_ORDER顺序排列的(弃牌, 过牌, 跟注, 加注, 全下)期望价值
+        """
+        return compute_evs(hand_strength, position_advantage, float(pot), float(call_amount),
+                           raise_amount, float(chips))
 
-    def _calculate_optimal_raise(self, player: Player, game_state: Dict[str, Any],
-                                 raise_data: Dict[str, float]) -> int:
+    def _calculate_optimal_raise(self, player: Player, game_state: GameState,
+                                 raise_ev: float) -> int:
         """计算最优加注金额"""
-        min_raise = game_state['min_raise']
-        pot_size = game_state['pot']
+        min_raise = game_state.min_raise
+        pot_size = game_state.pot
 
         # 基于EV和频率计算最优加注尺度
-        optimal_fraction = 0.5 + raise_data['ev'] * 0.5  # EV越高，加注越大
+        optimal_fraction = 0.5 + raise_ev * 0.5  # EV越高，加注越大
         raise_amount = int(pot_size * optimal_fraction)
         raise_amount = max(min_raise, raise_amount)
         raise_amount = min(raise_amount, player.chips)
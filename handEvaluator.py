@@ -1,159 +1,483 @@
-from typing import List, Tuple
+import bisect
+import math
+import os
+from itertools import combinations
+from typing import Dict, List, Optional, Tuple
 
-from card import Card
-from rank import Rank
+import numpy as np
+
+from card import CARDS, RANK_PRIMES, Card, card_id, card_mask
+from deck import Deck, remaining_cards
+from evalCore import COMBOS_5C5, COMBOS_6C5, COMBOS_7C5, WORST_RANK, eval7, eval7_batch
+from jit import NUMBA_AVAILABLE
+
+# GPU评估需显式开启（环境变量TEXAS_USE_GPU=1），未开启时即使装了cupy也只用numpy
+USE_GPU = os.environ.get("TEXAS_USE_GPU") == "1"
+
+cupy = None
+if USE_GPU:
+    try:
+        import cupy
+        if cupy.cuda.runtime.getDeviceCount() == 0:
+            cupy = None
+    except Exception:
+        cupy = None
+
+# 批量评估用的查找表
+# _HIGH_BIT[m]: 掩码m最高位的位置（m为0时为-1）
+_HIGH_BIT = np.array([m.bit_length() - 1 for m in range(1 << 14)], dtype=np.int32)
+# _TOP_RANKS[m]: 13位点数掩码中最大的5个点数，按(点数序号+1)每4位一个从高到低排列
+_TOP_RANKS = np.zeros(1 << 13, dtype=np.int32)
+for _m in range(1 << 13):
+    _ranks = [r for r in range(12, -1, -1) if _m >> r & 1][:5]
+    _TOP_RANKS[_m] = sum((r + 1) << (4 * (4 - i)) for i, r in enumerate(_ranks))
+# _POPCOUNT[m]: 13位掩码中1的个数
+_POPCOUNT = np.array([bin(m).count("1") for m in range(1 << 13)], dtype=np.int32)
+
+# 按数组模块（numpy/cupy）存放的查找表，GPU上的副本在导入时上传一次
+_TABLES = {np: (_HIGH_BIT, _TOP_RANKS, _POPCOUNT)}
+if cupy is not None:
+    _TABLES[cupy] = tuple(cupy.asarray(table) for table in _TABLES[np])
+
+# 单次评估的手牌数达到该值时才交给GPU，规模太小时传输开销大于收益
+GPU_MIN_BATCH = 4096
+
+# 精确枚举胜率时允许评估的最多对手手牌数，超过时应改用蒙特卡洛
+# （河牌圈单个对手为C(45,2)=990手，转牌圈为46*C(45,2)=45540手）
+EXACT_EQUITY_MAX_HANDS = 4096
+
+
+# 各牌型在等级编号中的上界，以及对应的牌型:
+# 9=皇家同花顺, 8=同花顺, 7=四条, 6=葫芦, 5=同花, 4=顺子, 3=三条, 2=两对, 1=一对, 0=高牌
+_CATEGORY_UPPER = (1, 10, 166, 322, 1599, 1609, 2467, 3325, 6185, WORST_RANK)
+_CATEGORIES = (9, 8, 7, 6, 5, 4, 3, 2, 1, 0)
+
+# 纯Python评估路径使用的下标组合（与evalCore的组合表相同，转为元组便于解包）
+_COMBO_INDICES = {n: tuple(map(tuple, combos.tolist()))
+                  for n, combos in ((5, COMBOS_5C5), (6, COMBOS_6C5), (7, COMBOS_7C5))}
+
+
+def _build_lookup_tables() -> Tuple[Dict[int, int], Dict[int, int]]:
+    """
+    按牌力从强到弱枚举所有5张牌的点数组合，生成等级查找表
+
+    Returns:
+        (FLUSH_LOOKUP, UNSUITED_LOOKUP) 元组
+        FLUSH_LOOKUP: 同花时以13位点数掩码为键
+        UNSUITED_LOOKUP: 非同花时以5张牌的点数素数之积为键
+    """
+    flush_lookup = {}
+    unsuited_lookup = {}
+    ranks_desc = range(12, -1, -1)
+
+    def product(ranks):
+        return math.prod(RANK_PRIMES[r] for r in ranks)
+
+    # 顺子的点数掩码，从A高到5高（A-5顺子）
+    straights = [0b11111 << low for low in range(8, -1, -1)] + [0b1000000001111]
+    straight_set = set(straights)
+    # 各不相同的5个点数，按字典序从大到小排列，剔除顺子
+    distinct = [combo for combo in combinations(ranks_desc, 5)
+                if sum(1 << r for r in combo) not in straight_set]
+
+    rank = 1
+    # 同花顺
+    for mask in straights:
+        flush_lookup[mask] = rank
+        rank += 1
+    # 四条
+    for quad in ranks_desc:
+        for kicker in ranks_desc:
+            if kicker != quad:
+                unsuited_lookup[product((quad,) * 4 + (kicker,))] = rank
+                rank += 1
+    # 葫芦
+    for trips in ranks_desc:
+        for pair in ranks_desc:
+            if pair != trips:
+                unsuited_lookup[product((trips,) * 3 + (pair,) * 2)] = rank
+                rank += 1
+    # 同花
+    for combo in distinct:
+        flush_lookup[sum(1 << r for r in combo)] = rank
+        rank += 1
+    # 顺子
+    for mask in straights:
+        unsuited_lookup[product(r for r in range(13) if mask >> r & 1)] = rank
+        rank += 1
+    # 三条
+    for trips in ranks_desc:
+        for kickers in combinations([r for r in ranks_desc if r != trips], 2):
+            unsuited_lookup[product((trips,) * 3 + kickers)] = rank
+            rank += 1
+    # 两对
+    for high, low in combinations(ranks_desc, 2):
+        for kicker in ranks_desc:
+            if kicker != high and kicker != low:
+                unsuited_lookup[product((high, high, low, low, kicker))] = rank
+                rank += 1
+    # 一对
+    for pair in ranks_desc:
+        for kickers in combinations([r for r in ranks_desc if r != pair], 3):
+            unsuited_lookup[product((pair, pair) + kickers)] = rank
+            rank += 1
+    # 高牌
+    for combo in distinct:
+        unsuited_lookup[product(combo)] = rank
+        rank += 1
+
+    assert rank - 1 == WORST_RANK
+    return flush_lookup, unsuited_lookup
+
+
+FLUSH_LOOKUP, UNSUITED_LOOKUP = _build_lookup_tables()
+
+# 供evalCore.eval7使用的稠密表: 同花表以点数掩码为下标，非同花表按素数之积排序后二分查找
+_FLUSH_TABLE = np.zeros(1 << 13, dtype=np.int16)
+for _mask, _rank in FLUSH_LOOKUP.items():
+    _FLUSH_TABLE[_mask] = _rank
+_UNSUITED_KEYS = np.array(sorted(UNSUITED_LOOKUP), dtype=np.int64)
+_UNSUITED_VALUES = np.array([UNSUITED_LOOKUP[key] for key in _UNSUITED_KEYS.tolist()], dtype=np.int16)
+
+# 牌编号（0-51）到Cactus Kev编码的映射
+_ENCODED = np.array(CARDS, dtype=np.int32)
+
+# 导入时先编译一次评估内核，避免游戏中第一次摊牌时的编译延迟
+if NUMBA_AVAILABLE:
+    eval7(_ENCODED[:7], _FLUSH_TABLE, _UNSUITED_KEYS, _UNSUITED_VALUES)
+    eval7_batch(_ENCODED[:7].reshape(1, 7), _FLUSH_TABLE, _UNSUITED_KEYS, _UNSUITED_VALUES)
+
+
+def _evaluate5(c1: int, c2: int, c3: int, c4: int, c5: int) -> int:
+    """评估5张编码牌，返回等级编号（越小越强）"""
+    # 5张牌的花色位全部相同即为同花
+    if c1 & c2 & c3 & c4 & c5 & 0xF000:
+        return FLUSH_LOOKUP[(c1 | c2 | c3 | c4 | c5) >> 16]
+    return UNSUITED_LOOKUP[(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)]
+
+
+def _straight_high(mask, high_bit):
+    """返回点数掩码中最大顺子的最高点序号（A-5顺子为3），没有顺子时为-1"""
+    # 最低位补上A，用于识别A-5顺子
+    m = (mask << 1) | ((mask >> 12) & 1)
+    s = m & (m >> 1) & (m >> 2) & (m >> 3) & (m >> 4)
+    high = high_bit[s]
+    return (high >= 0) * (high + 4) - 1
 
 
 class HandEvaluator:
-    """手牌评估器，用于评估扑克手牌的强度"""
+    """
+    手牌评估器，用于评估扑克手牌的强度
+
+    各评估方法返回值的约定:
+        evaluate_hand / evaluate_codes / evaluate_codes_batch / evaluate_ranks:
+            Cactus Kev等级编号1-WORST_RANK(7462)，数值越小手牌越强（与phevaluator一致）
+        evaluate_batch:
+            按牌型和踢子打包的分数，数值越大手牌越强，与等级编号方向相反、不能混用
+    """
 
     @staticmethod
-    def evaluate_hand(cards: List[Card]) -> Tuple[int, List[int]]:
+    def evaluate_hand(cards: List[Card]) -> int:
         """
-        评估手牌强度
+        评估手牌强度（Cactus Kev查表法）
+
+        对所有5张牌组合查表，取其中最好的等级
 
         Args:
-            cards: 要评估的牌列表（至少5张）
+            cards: 要评估的牌列表（5-7张）
 
         Returns:
-            (手牌等级, 踢子列表) 元组
-            手牌等级: 9=皇家同花顺, 8=同花顺, 7=四条, 6=葫芦, 5=同花, 4=顺子, 3=三条, 2=两对, 1=一对, 0=高牌
-            踢子列表: 用于比较同等级手牌的牌值列表
-        """
-        if len(cards) < 5:
-            return 0, []
-
-        # 按花色和点数分组
-        rank_count = {}
-        suit_count = {}
-
-        for card in cards:
-            rank_count[card.rank] = rank_count.get(card.rank, 0) + 1
-            suit_count[card.suit] = suit_count.get(card.suit, 0) + 1
-
-        # 检查同花
-        flush_suit = None
-        for suit, count in suit_count.items():
-            if count >= 5:
-                flush_suit = suit
-                break
-
-        # 同花牌
-        flush_cards = [card for card in cards if card.suit == flush_suit] if flush_suit else []
-
-        # 检查顺子
-        sorted_ranks = sorted(set(card.rank.value for card in cards), reverse=True)
-        straight_high = None
-
-        # 检查A-5顺子（A作为1使用）
-        if (Rank.ACE.value in sorted_ranks and
-                Rank.TWO.value in sorted_ranks and
-                Rank.THREE.value in sorted_ranks and
-                Rank.FOUR.value in sorted_ranks and
-                Rank.FIVE.value in sorted_ranks):
-            straight_high = Rank.FIVE.value
-
-        # 检查普通顺子
-        for i in range(len(sorted_ranks) - 4):
-            if sorted_ranks[i] - sorted_ranks[i + 4] == 4:
-                straight_high = sorted_ranks[i]
-                break
-
-        # 同花顺
-        if flush_suit and straight_high:
-            straight_flush_cards = [card for card in flush_cards if
-                                    card.rank.value <= straight_high and card.rank.value >= straight_high - 4]
-            if len(straight_flush_cards) >= 5:
-                # 皇家同花顺
-                if straight_high == Rank.ACE.value:
-                    return 9, [straight_high]
-                return 8, [straight_high]
-
-        # 四条
-        four_of_a_kind = None
-        for rank, count in rank_count.items():
-            if count == 4:
-                four_of_a_kind = rank.value
-                break
-
-        if four_of_a_kind:
-            kickers = [rank.value for rank in rank_count if rank.value != four_of_a_kind]
-            kickers.sort(reverse=True)
-            return 7, [four_of_a_kind] + kickers[:1]
-
-        # 葫芦
-        three_of_a_kind = None
-        pairs = []
-        for rank, count in rank_count.items():
-            if count == 3:
-                three_of_a_kind = rank.value
-            elif count == 2:
-                pairs.append(rank.value)
-
-        pairs.sort(reverse=True)
-
-        if three_of_a_kind and pairs:
-            return 6, [three_of_a_kind, pairs[0]]
-
-        # 同花
-        if flush_suit:
-            flush_ranks = [card.rank.value for card in flush_cards]
-            flush_ranks.sort(reverse=True)
-            return 5, flush_ranks[:5]
-
-        # 顺子
-        if straight_high:
-            return 4, [straight_high]
-
-        # 三条
-        if three_of_a_kind:
-            kickers = [rank.value for rank in rank_count if rank.value != three_of_a_kind]
-            kickers.sort(reverse=True)
-            return 3, [three_of_a_kind] + kickers[:2]
-
-        # 两对
-        if len(pairs) >= 2:
-            pairs.sort(reverse=True)
-            kickers = [rank.value for rank in rank_count if rank.value not in pairs[:2]]
-            kickers.sort(reverse=True)
-            return 2, pairs[:2] + kickers[:1]
-
-        # 一对
-        if pairs:
-            kickers = [rank.value for rank in rank_count if rank.value != pairs[0]]
-            kickers.sort(reverse=True)
-            return 1, [pairs[0]] + kickers[:3]
-
-        # 高牌
-        high_cards = sorted([card.rank.value for card in cards], reverse=True)
-        return 0, high_cards[:5]
+            手牌等级编号，1为皇家同花顺，WORST_RANK为最小的高牌，数值越小手牌越强；
+            不足5张牌时返回WORST_RANK
+        """
+        n = len(cards)
+        if n < 5:
+            return WORST_RANK
+
+        # 有numba时交给编译后的内核
+        if NUMBA_AVAILABLE and n <= 7:
+            return int(eval7(np.array(cards, dtype=np.int32), _FLUSH_TABLE, _UNSUITED_KEYS, _UNSUITED_VALUES))
+
+        combos = _COMBO_INDICES.get(n) or tuple(combinations(range(n), 5))
+        best = WORST_RANK
+        for a, b, c, d, e in combos:
+            rank = _evaluate5(cards[a], cards[b], cards[c], cards[d], cards[e])
+            if rank < best:
+                best = rank
+        return best
 
     @staticmethod
-    def compare_hands(hand1: Tuple[int, List[int]], hand2: Tuple[int, List[int]]) -> int:
+    def evaluate_codes(cards: np.ndarray) -> int:
         """
-        比较两手牌的强度
+        评估Cactus Kev编码的int32牌数组（省去牌列表到数组的转换）
 
         Args:
-            hand1: 第一手牌的(等级, 踢子)元组
-            hand2: 第二手牌的(等级, 踢子)元组
+            cards: 编码牌的int32数组（5-7张）
 
         Returns:
-            -1: hand1 < hand2
-            0: hand1 == hand2
-            1: hand1 > hand2
+            与evaluate_hand相同的等级编号，数值越小手牌越强
+        """
+        if NUMBA_AVAILABLE and 5 <= len(cards) <= 7:
+            return int(eval7(cards, _FLUSH_TABLE, _UNSUITED_KEYS, _UNSUITED_VALUES))
+        return HandEvaluator.evaluate_hand([CARDS[card_id(card)] for card in cards.tolist()])
+
+    @staticmethod
+    def evaluate_codes_batch(hands: np.ndarray) -> np.ndarray:
         """
-        rank1, kickers1 = hand1
-        rank2, kickers2 = hand2
+        一次评估多手Cactus Kev编码的牌（如摊牌时所有玩家的7张牌）
+
+        Args:
+            hands: 形状为(N, m)的编码牌int32数组，每行一手牌
+
+        Returns:
+            形状为(N,)的等级编号数组，与evaluate_codes相同，数值越小手牌越强；
+            每手不足5张牌时全部为WORST_RANK
+        """
+        n_cards = hands.shape[1]
+        if n_cards < 5:
+            return np.full(hands.shape[0], WORST_RANK, dtype=np.int32)
+        if NUMBA_AVAILABLE and n_cards <= 7:
+            return eval7_batch(np.ascontiguousarray(hands), _FLUSH_TABLE, _UNSUITED_KEYS, _UNSUITED_VALUES)
+        return np.array([HandEvaluator.evaluate_codes(hand) for hand in hands], dtype=np.int32)
+
+    @staticmethod
+    def rank_category(rank: int) -> int:
+        """
+        由等级编号得到牌型
+
+        Args:
+            rank: evaluate_hand返回的等级编号
+
+        Returns:
+            牌型: 9=皇家同花顺, 8=同花顺, 7=四条, 6=葫芦, 5=同花, 4=顺子, 3=三条, 2=两对, 1=一对, 0=高牌
+        """
+        return _CATEGORIES[bisect.bisect_left(_CATEGORY_UPPER, rank)]
+
+    @staticmethod
+    def evaluate_batch(card_ids: np.ndarray, xp=None) -> np.ndarray:
+        """
+        批量评估手牌强度（向量化，无Python层循环）
+
+        开启了GPU且输入为cupy数组时整个计算在GPU上完成
+
+        Args:
+            card_ids: 形状为(..., m)的牌编号数组（numpy或cupy），最后一维为一手牌（至少5张）
+            xp: 使用的数组模块（np或cupy），默认按输入数组推断
+
+        Returns:
+            形状为(...)的整数数组，数值越大手牌越强（与等级编号方向相反）；
+            高位为与rank_category相同的牌型，低20位为踢子
+        """
+        if xp is None:
+            xp = cupy.get_array_module(card_ids) if cupy is not None else np
+        high_bit, top_ranks, popcount = _TABLES[xp]
+
+        card_ids = xp.asarray(card_ids, dtype=xp.int64)
+
+        # 只对输入牌做一次归约: 每张牌对应 花色*13+点数 的一位，牌互不相同所以求和即按位或；
+        # 之后的点数掩码、各花色点数掩码和张数都从这一个52位掩码得到
+        cards_mask = (xp.int64(1) << (13 * (card_ids & 3) + (card_ids >> 2))).sum(axis=-1)
+        suit_masks = (cards_mask[..., None] >> (13 * xp.arange(4, dtype=xp.int64))) & 0x1FFF
+        s0, s1, s2, s3 = (suit_masks[..., i] for i in range(4))
 
-        if rank1 > rank2:
+        # 四个花色掩码逐位相加，得到每个点数张数的二进制各位
+        low_sum, low_carry = s0 ^ s1, s0 & s1
+        high_sum, high_carry = s2 ^ s3, s2 & s3
+        bit0 = low_sum ^ high_sum
+        carry = low_sum & high_sum
+        bit1 = low_carry ^ high_carry ^ carry
+        rank_mask = s0 | s1 | s2 | s3
+        quad_mask = low_carry & high_carry
+        trip_mask = bit0 & bit1
+        pair_mask = bit1 & ~bit0
+
+        # 同花: 各花色的张数即花色掩码中1的个数
+        suit_counts = popcount[suit_masks]
+        flush_suit = suit_counts.argmax(axis=-1)
+        has_flush = suit_counts.max(axis=-1) >= 5
+        flush_mask = xp.take_along_axis(suit_masks, flush_suit[..., None], axis=-1)[..., 0]
+
+        # 顺子与同花顺
+        straight = _straight_high(rank_mask, high_bit)
+        straight_flush = xp.where(has_flush, _straight_high(flush_mask, high_bit), -1)
+
+        # 各牌型的关键点数（不存在时为-1）
+        quads = high_bit[quad_mask]
+        trips = high_bit[trip_mask]
+        full_pair = high_bit[(trip_mask | pair_mask) & ~(1 << xp.maximum(trips, 0))]
+        pair1 = high_bit[pair_mask]
+        pair2 = high_bit[pair_mask & ~(1 << xp.maximum(pair1, 0))]
+        without_quads = rank_mask & ~(1 << xp.maximum(quads, 0))
+        without_trips = rank_mask & ~(1 << xp.maximum(trips, 0))
+        without_pair1 = rank_mask & ~(1 << xp.maximum(pair1, 0))
+        without_pairs = without_pair1 & ~(1 << xp.maximum(pair2, 0))
+
+        conditions = [
+            straight_flush == 12,
+            straight_flush >= 0,
+            quads >= 0,
+            (trips >= 0) & (full_pair >= 0),
+            has_flush,
+            straight >= 0,
+            trips >= 0,
+            pair2 >= 0,
+            pair1 >= 0,
+        ]
+        choices = [
+            (9 << 20) | ((straight_flush + 1) << 16),
+            (8 << 20) | ((straight_flush + 1) << 16),
+            (7 << 20) | ((quads + 1) << 16) | ((high_bit[without_quads] + 1) << 12),
+            (6 << 20) | ((trips + 1) << 16) | ((full_pair + 1) << 12),
+            (5 << 20) | top_ranks[flush_mask],
+            (4 << 20) | ((straight + 1) << 16),
+            (3 << 20) | ((trips + 1) << 16) | ((top_ranks[without_trips] >> 12) << 8),
+            (2 << 20) | ((pair1 + 1) << 16) | ((pair2 + 1) << 12) | ((high_bit[without_pairs] + 1) << 8),
+            (1 << 20) | ((pair1 + 1) << 16) | ((top_ranks[without_pair1] >> 8) << 4),
+        ]
+        return xp.select(conditions, choices, default=top_ranks[rank_mask])
+
+    @staticmethod
+    def evaluate_ranks(card_ids: np.ndarray) -> np.ndarray:
+        """
+        批量计算手牌的Cactus Kev等级编号
+
+        Args:
+            card_ids: 形状为(..., m)的牌编号数组，最后一维为一手牌（5-7张）
+
+        Returns:
+            形状为(...)的等级编号数组，与evaluate_hand相同，数值越小手牌越强
+        """
+        card_ids = np.asarray(card_ids)
+        hands = _ENCODED[card_ids.reshape(-1, card_ids.shape[-1])]
+        if NUMBA_AVAILABLE:
+            ranks = eval7_batch(hands, _FLUSH_TABLE, _UNSUITED_KEYS, _UNSUITED_VALUES)
+        else:
+            ranks = np.array([HandEvaluator.evaluate_hand(hand.tolist()) for hand in hands], dtype=np.int32)
+        return ranks.reshape(card_ids.shape[:-1])
+
+    @staticmethod
+    def estimate_equity(hand: List[Card], community_cards: List[Card], deck: Deck,
+                        n_opponents: int = 1, n_runouts: int = 1000) -> float:
+        """
+        用蒙特卡洛模拟估计手牌胜率
+
+        一次性抽取全部模拟所需的公共牌和对手手牌，并批量评估
+
+        Args:
+            hand: 玩家的手牌
+            community_cards: 已发出的公共牌
+            deck: 用于随机抽牌的牌堆
+            n_opponents: 对手数量
+            n_runouts: 模拟次数
+
+        Returns:
+            胜率估计值 (0-1)，平局计为半次胜利
+        """
+        hand_ids = np.array([card_id(card) for card in hand], dtype=np.uint8)
+        board_ids = np.array([card_id(card) for card in community_cards], dtype=np.uint8)
+        missing = 5 - len(board_ids)
+
+        runouts = deck.sample_runouts(missing + 2 * n_opponents, n_runouts,
+                                      card_mask(hand) | card_mask(community_cards))
+        boards = np.concatenate([np.broadcast_to(board_ids, (n_runouts, board_ids.size)),
+                                 runouts[:, :missing]], axis=1)
+
+        hero_hands = np.concatenate([np.broadcast_to(hand_ids, (n_runouts, 2)), boards], axis=1)
+        opponent_holes = runouts[:, missing:].reshape(n_runouts, n_opponents, 2)
+        opponent_hands = np.concatenate(
+            [opponent_holes, np.broadcast_to(boards[:, None, :], (n_runouts, n_opponents, 5))], axis=2)
+
+        # 有numba时在CPU上用编译后的查表评估内核，等级编号越小越强
+        if NUMBA_AVAILABLE and (cupy is None or n_runouts * (n_opponents + 1) < GPU_MIN_BATCH):
+            hero = HandEvaluator.evaluate_ranks(hero_hands)
+            best_opponent = HandEvaluator.evaluate_ranks(opponent_hands).min(axis=1)
+            return float((hero < best_opponent).mean() + 0.5 * (hero == best_opponent).mean())
+
+        # 开启了GPU且所有模拟中所有对手的手牌规模足够大时，一次性上传到GPU评估
+        if cupy is not None and n_runouts * (n_opponents + 1) >= GPU_MIN_BATCH:
+            hero_hands = cupy.asarray(hero_hands)
+            opponent_hands = cupy.asarray(opponent_hands)
+
+        hero = HandEvaluator.evaluate_batch(hero_hands)
+        best_opponent = HandEvaluator.evaluate_batch(opponent_hands).max(axis=1)
+        return float((hero > best_opponent).mean() + 0.5 * (hero == best_opponent).mean())
+
+    @staticmethod
+    def exact_equity_hands(community_cards: List[Card]) -> int:
+        """
+        精确枚举单个对手的胜率时需要评估的对手手牌数
+
+        Args:
+            community_cards: 已发出的公共牌
+
+        Returns:
+            剩余公共牌组合数 * 对手底牌组合数
+        """
+        remaining = 50 - len(community_cards)
+        missing = 5 - len(community_cards)
+        return math.comb(remaining, missing) * math.comb(remaining - missing, 2)
+
+    @staticmethod
+    def exact_equity(hand: List[Card], community_cards: List[Card],
+                     opponent: Optional[List[Card]] = None) -> float:
+        """
+        枚举所有剩余公共牌和对手底牌，计算对一个对手的精确胜率
+
+        每种(剩余公共牌, 对手底牌)组合出现的概率相同，全部组合一次批量评估
+
+        Args:
+            hand: 玩家的手牌
+            community_cards: 已发出的公共牌
+            opponent: 对手的底牌，为None时对手为随机手牌（枚举所有底牌组合）
+
+        Returns:
+            精确胜率 (0-1)，平局计为半次胜利
+        """
+        hand_ids = np.array([card_id(card) for card in hand], dtype=np.uint8)
+        board_ids = np.array([card_id(card) for card in community_cards], dtype=np.uint8)
+        missing = 5 - len(board_ids)
+        dead_mask = card_mask(hand) | card_mask(community_cards)
+        if opponent is not None:
+            dead_mask |= card_mask(opponent)
+        remaining = remaining_cards(dead_mask)
+
+        # 所有剩余公共牌组合 (C, missing)，以及所有对手底牌组合 (P, 2)
+        completions = remaining[np.array(list(combinations(range(remaining.size), missing)),
+                                         dtype=np.intp).reshape(math.comb(remaining.size, missing), missing)]
+        if opponent is None:
+            holes = remaining[np.array(list(combinations(range(remaining.size), 2)), dtype=np.intp)]
+        else:
+            holes = np.array([[card_id(card) for card in opponent]], dtype=np.uint8)
+        boards = np.concatenate([np.broadcast_to(board_ids, (len(completions), board_ids.size)),
+                                 completions], axis=1)
+
+        # 对手底牌不能与补出的公共牌重复
+        valid = ~(holes[None, :, :, None] == completions[:, None, None, :]).any(axis=(2, 3))
+        board_index, hole_index = np.nonzero(valid)
+
+        hero = HandEvaluator.evaluate_ranks(
+            np.concatenate([np.broadcast_to(hand_ids, (len(boards), 2)), boards], axis=1))[board_index]
+        opponent = HandEvaluator.evaluate_ranks(
+            np.concatenate([holes[hole_index], boards[board_index]], axis=1))
+        return float((hero < opponent).mean() + 0.5 * (hero == opponent).mean())
+
+    @staticmethod
+    def compare_hands(hand1: int, hand2: int) -> int:
+        """
+        比较两手牌的强度
+
+        Args:
+            hand1: 第一手牌的等级编号
+            hand2: 第二手牌的等级编号
+
+        Returns:
+            1: hand1更强（等级编号更小）
+            0: 强度相同
+            -1: hand2更强
+        """
+        # 等级编号越小手牌越强
+        if hand1 < hand2:
             return 1
-        elif rank1 < rank2:
+        elif hand1 > hand2:
             return -1
-        else:
-            # 等级相同，比较踢子
-            for k1, k2 in zip(kickers1, kickers2):
-                if k1 > k2:
-                    return 1
-                elif k1 < k2:
-                    return -1
-            return 0
+        return 0
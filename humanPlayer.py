@@ -1,12 +1,13 @@
-from typing import Dict, Any, Tuple
+from typing import Tuple
 from action import Action
+from gameState import GameState
 from player import Player
 
 
 class HumanPlayer(Player):
     """人类玩家类，通过控制台输入进行决策"""
 
-    def make_decision(self, game_state: Dict[str, Any]) -> Tuple[Action, int]:
+    def make_decision(self, game_state: GameState) -> Tuple[Action, int]:
         """
         人类玩家通过控制台输入做出决策
 
@@ -19,9 +20,9 @@ class HumanPlayer(Player):
         print(f"\n{self.name}'s turn.")
         print(f"Your chips: ${self.chips}")
         print(f"Your hand: {self.hand}")
-        print(f"Community cards: {game_state['community_cards']}")
-        print(f"Current bet: ${game_state['current_bet']}")
-        print(f"Pot size: ${game_state['pot']}")
+        print(f"Community cards: {game_state.community_cards}")
+        print(f"Current bet: ${game_state.current_bet}")
+        print(f"Pot size: ${game_state.pot}")
 
         while True:
             try:
@@ -32,12 +33,12 @@ class HumanPlayer(Player):
                 elif action_input == "check" or action_input == "ck":
                     return Action.CHECK, 0
                 elif action_input == "call" or action_input == "ca":
-                    call_amount = game_state['current_bet'] - self.current_bet
+                    call_amount = game_state.current_bet - self.current_bet
                     if call_amount > self.chips:
                         return Action.ALL_IN, self.chips
                     return Action.CALL, call_amount
                 elif action_input == "raise" or action_input == "r":
-                    min_raise = game_state['min_raise']
+                    min_raise = game_state.min_raise
                     amount = int(input(f"Enter raise amount (minimum ${min_raise}): "))
                     if amount < min_raise:
                         print(f"Raise amount must be at least ${min_raise}")
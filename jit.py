@@ -0,0 +1,18 @@
+"""即时编译支持：安装了numba时使用numba.njit，否则退化为普通Python函数"""
+
+try:
+    from numba import njit
+    # numba是否可用，不可用时被装饰的函数按普通Python执行，调用方可据此选择更快的纯Python实现
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """numba不可用时的占位装饰器，原样返回被装饰的函数"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
@@ -14,15 +14,15 @@ class Player:
             name: 玩家名称
             chips: 初始筹码数量
         """
-        self.name = name
-        self.chips = chips
-        self.hand = []
+        self.name: str = name
+        self.chips: int = chips
+        self.hand: List[Card] = []
         #当前已下注额度
-        self.current_bet = 0
+        self.current_bet: int = 0
         #是否弃牌
-        self.folded = False
+        self.folded: bool = False
         #是否allin
-        self.all_in = False
+        self.all_in: bool = False
 
     def reset_hand(self):
         """重置玩家手牌状态，开始新的一轮"""
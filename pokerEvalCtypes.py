@@ -0,0 +1,56 @@
+"""通过ctypes调用C语言实现的7张牌评估器（phevaluator）"""
+
+import ctypes
+import ctypes.util
+from typing import List
+
+import numpy as np
+
+from card import Card, card_id
+from handEvaluator import HandEvaluator
+
+def _load_library():
+    """加载phevaluator动态库，找不到时返回None"""
+    path = ctypes.util.find_library("phevaluator") or "libphevaluator.so"
+    try:
+        lib = ctypes.CDLL(path)
+    except OSError:
+        return None
+    lib.evaluate_7cards.argtypes = [ctypes.c_int] * 7
+    lib.evaluate_7cards.restype = ctypes.c_int
+    return lib
+
+
+_lib = _load_library()
+
+
+def evaluate7(c0: int, c1: int, c2: int, c3: int, c4: int, c5: int, c6: int) -> int:
+    """
+    评估7张牌的强度
+
+    牌编号为点数序号*4+花色序号（0-51），与phevaluator的编号方式一致
+
+    Args:
+        c0-c6: 7张牌的牌编号
+
+    Returns:
+        手牌等级编号1-7462，数值越小手牌越强；
+        找不到C库时回退到HandEvaluator.evaluate_ranks，等级编号的约定相同
+    """
+    if _lib is not None:
+        return _lib.evaluate_7cards(c0, c1, c2, c3, c4, c5, c6)
+    ids = np.array([[c0, c1, c2, c3, c4, c5, c6]], dtype=np.uint8)
+    return int(HandEvaluator.evaluate_ranks(ids)[0])
+
+
+def evaluate_cards(cards: List[Card]) -> int:
+    """
+    评估7张扑克牌的强度
+
+    Args:
+        cards: 7张牌（如2张手牌+5张公共牌）
+
+    Returns:
+        手牌强度值，数值越小手牌越强
+    """
+    return evaluate7(*(card_id(card) for card in cards))
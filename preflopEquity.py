@@ -0,0 +1,81 @@
+"""169种规范起手牌的翻牌前强度表"""
+
+import math
+
+import numpy as np
+
+from card import Card, card_rank, same_suit
+
+
+def canonical_index(r1: int, r2: int, suited: bool) -> int:
+    """
+    起手牌在169种规范起手牌中的下标
+
+    0-12为对子，13-90为同花，91-168为不同花（同花和不同花内部按(大点数, 小点数)排列）
+
+    Args:
+        r1: 第一张牌点数
+        r2: 第二张牌点数
+        suited: 是否同花
+
+    Returns:
+        规范起手牌下标 (0-168)
+    """
+    hi, lo = (r1, r2) if r1 >= r2 else (r2, r1)
+    if hi == lo:
+        return hi - 2
+    offset = (hi - 2) * (hi - 3) // 2 + (lo - 2)
+    return 13 + offset if suited else 91 + offset
+
+
+def preflop_index(card1: Card, card2: Card) -> int:
+    """
+    两张手牌对应的规范起手牌下标
+
+    Args:
+        card1: 第一张手牌
+        card2: 第二张手牌
+
+    Returns:
+        规范起手牌下标 (0-168)
+    """
+    return canonical_index(card_rank(card1), card_rank(card2), same_suit(card1, card2))
+
+
+def _chen_score(hi: int, lo: int, suited: bool) -> float:
+    """Chen公式计算起手牌得分（AA为20分，最差约为-1分）"""
+    # 最大牌的分数: A=10, K=8, Q=7, J=6, 其余为点数的一半
+    high_points = {14: 10.0, 13: 8.0, 12: 7.0, 11: 6.0}
+    score = high_points.get(hi, hi / 2.0)
+
+    # 对子分数加倍，最少5分
+    if hi == lo:
+        return max(5.0, score * 2)
+
+    # 同花加分
+    if suited:
+        score += 2
+
+    # 间隔扣分
+    gap = hi - lo - 1
+    score -= (0, 1, 2, 4)[gap] if gap < 4 else 5
+
+    # 两张都小于Q的连张或隔一张加1分
+    if gap <= 1 and hi < 12:
+        score += 1
+
+    return float(math.ceil(score))
+
+
+def _build_preflop_table() -> np.ndarray:
+    """按Chen公式生成169种起手牌的强度，归一化到0-1范围"""
+    table = np.zeros(169, dtype=np.float32)
+    for hi in range(2, 15):
+        for lo in range(2, hi + 1):
+            for suited in ((False,) if hi == lo else (False, True)):
+                table[canonical_index(hi, lo, suited)] = _chen_score(hi, lo, suited) / 20.0
+    return np.clip(table, 0.0, 1.0)
+
+
+# 翻牌前强度表，下标由preflop_index给出
+PREFLOP = _build_preflop_table()
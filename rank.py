@@ -1,8 +1,8 @@
-from enum import Enum
+from enum import IntEnum
 
 
-class Rank(Enum):
-    """扑克牌点数枚举"""
+class Rank(IntEnum):
+    """扑克牌点数枚举（成员本身即为整数点数）"""
     TWO = 2
     THREE = 3
     FOUR = 4
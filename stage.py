@@ -0,0 +1,9 @@
+from enum import IntEnum
+
+
+class Stage(IntEnum):
+    """游戏阶段枚举（成员本身即为整数，可直接作为按阶段排列的表的下标）"""
+    PREFLOP = 0
+    FLOP = 1
+    TURN = 2
+    RIVER = 3
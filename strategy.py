@@ -1,14 +1,149 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 from action import Action
-from typing import Dict, Any, Tuple, List
+from typing import Tuple, List
 
 from card import Card
+from deck import Deck
+from gameState import GameState
+from handEvaluator import EXACT_EQUITY_MAX_HANDS, HandEvaluator
+from jit import NUMBA_AVAILABLE, njit
 from player import Player
+from preflopEquity import PREFLOP, preflop_index
+
+# 手牌强度模拟专用的牌堆（只用于随机抽样，不参与发牌）
+_SIM_DECK = Deck()
+
+# 决策内核返回的行动编号对应的行动
+_ACTIONS = (Action.FOLD, Action.CHECK, Action.CALL, Action.RAISE)
+
+
+# 各阈值策略的决策参数:
+# ((加注阈值, 跟注阈值, 主动下注阈值), (加注底池比例, 主动下注底池比例))
+STRATEGY_TABLES = {
+    'basic': ((0.7, 0.3, 0.6), (0.5, 0.3)),
+    'aggressive': ((0.5, 0.2, 0.4), (0.75, 0.5)),
+    'conservative': ((0.6, 0.4, 0.7), (0.3, 0.2)),
+}
+
+
+@njit(cache=True, nogil=True)
+def _threshold_decide_kernel(hand_strength: float, call_amount: int, min_raise: int,
+                             pot_size: int, chips: int, thresholds: Tuple[float, float, float],
+                             pot_fractions: Tuple[float, float]) -> Tuple[int, int]:
+    """
+    阈值策略的数值决策内核（可被numba编译为本地代码）
+
+    Args:
+        hand_strength: 手牌强度
+        call_amount: 跟注所需金额，0表示无人下注
+        min_raise: 最小加注额
+        pot_size: 底池大小
+        chips: 玩家剩余筹码
+        thresholds: (加注阈值, 跟注阈值, 主动下注阈值)
+        pot_fractions: (加注底池比例, 主动下注底池比例)
+
+    Returns:
+        (行动编号, 金额) 元组，行动编号为_ACTIONS中的下标
+    """
+    raise_threshold, call_threshold, bet_threshold = thresholds
+    raise_fraction, bet_fraction = pot_fractions
+
+    # 如果已经有人下注
+    if call_amount > 0:
+        # 手牌很强时加注
+        if hand_strength > raise_threshold and chips > call_amount + min_raise:
+            raise_amount = min(int(pot_size * raise_fraction), chips)
+            return 3, max(min_raise, raise_amount)
+
+        # 手牌中等时跟注
+        elif hand_strength > call_threshold and chips >= call_amount:
+            return 2, call_amount
+
+        # 手牌很弱时弃牌
+        else:
+            return 0, 0
+
+    # 如果没有人下注或只是跟注
+    # 手牌很强时下注
+    if hand_strength > bet_threshold:
+        bet_amount = min(int(pot_size * bet_fraction), chips)
+        return 3, max(min_raise, bet_amount)
+
+    # 手牌中等或很弱时过牌
+    return 1, 0
+
+
+# 导入时先编译一次决策内核，避免第一次决策时的编译延迟
+if NUMBA_AVAILABLE:
+    _threshold_decide_kernel(0.5, 0, 20, 0, 1000, *STRATEGY_TABLES['basic'])
+
+
+@lru_cache(maxsize=4096)
+def _hand_strength_cached(hand_key: Tuple[Card, ...], board_key: Tuple[Card, ...],
+                          deck: Deck = _SIM_DECK) -> float:
+    """
+    计算手牌强度（带缓存）
+
+    牌堆也是缓存键的一部分，不同线程的策略副本各自抽样，互不共享蒙特卡洛结果
+
+    Args:
+        hand_key: 排序后的手牌元组
+        board_key: 排序后的公共牌元组
+        deck: 蒙特卡洛抽样使用的牌堆
+
+    Returns:
+        手牌强度估计值 (0-1)
+    """
+    card1, card2 = hand_key
+
+    # 翻牌前直接查169种起手牌的强度表
+    if not board_key:
+        return float(PREFLOP[preflop_index(card1, card2)])
+
+    # 翻牌后用蒙特卡洛模拟得到真实胜率
+    return _mc_equity(hand_key, board_key, deck=deck)
+
+
+def _mc_equity(hero: Tuple[Card, ...], board: Tuple[Card, ...], n_opp: int = 1, iters: int = 200,
+               deck: Deck = _SIM_DECK) -> float:
+    """
+    估计翻牌后的胜率
+
+    单个对手且需要枚举的组合足够少（如河牌圈）时直接精确枚举；
+    否则用蒙特卡洛模拟，剩余公共牌和对手手牌一次性抽取为(iters, k)数组，并用批量评估内核评估
+
+    Args:
+        hero: 玩家手牌
+        board: 公共牌
+        n_opp: 对手数量
+        iters: 模拟次数
+        deck: 蒙特卡洛抽样使用的牌堆
+
+    Returns:
+        胜率估计值 (0-1)，平局计为半次胜利
+    """
+    # 没有numba时逐手评估太慢，只用蒙特卡洛
+    if (NUMBA_AVAILABLE and n_opp == 1
+            and HandEvaluator.exact_equity_hands(board) <= EXACT_EQUITY_MAX_HANDS):
+        return HandEvaluator.exact_equity(hero, board)
+    return HandEvaluator.estimate_equity(hero, board, deck, n_opp, iters)
+
+
+def clear_hand_strength_cache():
+    """清空手牌强度缓存（每手牌开始时调用，限制缓存占用的内存）"""
+    _hand_strength_cached.cache_clear()
 
 
 class PokerStrategy:
     """扑克策略基类，所有AI策略都应继承此类"""
 
-    def decide(self, player: Player, game_state: Dict[str, Any]) -> Tuple[Action, int]:
+    # 手牌强度模拟使用的牌堆，默认所有实例共享_SIM_DECK，_worker()的副本各自持有派生的牌堆
+    _sim_deck = _SIM_DECK
+
+    def decide(self, player: Player, game_state: GameState) -> Tuple[Action, int]:
         """
         做出决策的抽象方法，子类必须实现
 
@@ -21,100 +156,64 @@ class PokerStrategy:
         """
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _calculate_hand_strength(self, hand: List[Card], community_cards: List[Card]) -> float:
+    def decide_many(self, players: List[Player], game_state: GameState) -> List[Tuple[Action, int]]:
         """
-        计算手牌强度 (0-1之间的值)
+        在线程池中同时为多个玩家做出决策
+
+        每个玩家使用_worker()得到的策略实例，numpy和numba内核执行时会释放GIL
 
         Args:
-            hand: 玩家的手牌
-            community_cards: 公共牌
+            players: 做出决策的玩家列表
+            game_state: 当前游戏状态（只读）
 
         Returns:
-            手牌强度估计值，0表示最弱，1表示最强
+            与players顺序对应的(行动, 金额)元组列表
         """
-        if len(hand) < 2:
-            return 0.0
+        if not players:
+            return []
 
-        # 简单的手牌强度评估
-        card1, card2 = hand
-
-        # 对子
-        if card1.rank == card2.rank:
-            base_strength = 0.8
-        # 同花
-        elif card1.suit == card2.suit:
-            base_strength = 0.3
-        # 连牌
-        elif abs(card1.rank.value - card2.rank.value) == 1:
-            base_strength = 0.2
-        else:
-            base_strength = 0.1
+        workers = [self._worker() for _ in players]
+        with ThreadPoolExecutor(max_workers=len(players)) as executor:
+            return list(executor.map(lambda worker, player: worker.decide(player, game_state),
+                                     workers, players))
 
-        # 高牌加成
-        high_card_bonus = max(card1.rank.value, card2.rank.value) / 100
-
-        return min(1.0, base_strength + high_card_bonus)
+    def _worker(self) -> "PokerStrategy":
+        """
+        返回可以在其他线程中独立调用decide的策略实例
 
-class BasicStrategy(PokerStrategy):
-    """基础AI策略"""
+        副本的模拟牌堆使用由本实例牌堆派生的随机数生成器，线程之间不共享随机状态；
+        有决策内可变状态的子类应在此基础上替换各自的状态
+        """
+        worker = copy.copy(self)
+        worker._sim_deck = Deck(self._sim_deck.spawn_rngs(1)[0])
+        return worker
 
-    def decide(self, player: Player, game_state: Dict[str, Any]) -> Tuple[Action, int]:
+    def _calculate_hand_strength(self, hand: List[Card], community_cards: List[Card]) -> float:
         """
-        使用基础策略做出决策
+        计算手牌强度 (0-1之间的值)
 
         Args:
-            player: 做出决策的玩家
-            game_state: 当前游戏状态
+            hand: 玩家的手牌
+            community_cards: 公共牌
 
         Returns:
-            (行动, 金额) 元组
+            手牌强度估计值，0表示最弱，1表示最强
         """
-        hand_strength = self._calculate_hand_strength(player.hand, game_state['community_cards'])
-
-        # 获取当前下注信息
-        current_bet = game_state['current_bet']
-        min_raise = game_state['min_raise']
-        pot_size = game_state['pot']
-
-        # 如果已经有人下注
-        if current_bet > player.current_bet:
-            call_amount = current_bet - player.current_bet
-
-            # 手牌很强时加注
-            if hand_strength > 0.7 and player.chips > call_amount + min_raise:
-                raise_amount = min(int(pot_size * 0.5), player.chips)
-                return Action.RAISE, max(min_raise, raise_amount)
-
-            # 手牌中等时跟注
-            elif hand_strength > 0.3 and player.chips >= call_amount:
-                return Action.CALL, call_amount
-
-            # 手牌很弱时弃牌
-            else:
-                return Action.FOLD, 0
-
-        # 如果没有人下注或只是跟注
-        else:
-            # 手牌很强时下注
-            if hand_strength > 0.6:
-                bet_amount = min(int(pot_size * 0.3), player.chips)
-                return Action.RAISE, max(min_raise, bet_amount)
+        if len(hand) < 2:
+            return 0.0
 
-            # 手牌中等时过牌
-            elif hand_strength > 0.2:
-                return Action.CHECK, 0
+        # 以排序后的牌元组为键查缓存，同一轮中多次决策直接命中
+        return _hand_strength_cached(tuple(sorted(hand)), tuple(sorted(community_cards)), self._sim_deck)
 
-            # 手牌很弱时过牌
-            else:
-                return Action.CHECK, 0
 
+class ThresholdStrategy(PokerStrategy):
+    """阈值策略，只按手牌强度阈值和底池比例决定行动，子类通过_table选择STRATEGY_TABLES中的参数"""
 
-class AggressiveStrategy(PokerStrategy):
-    """激进策略"""
+    _table = STRATEGY_TABLES['basic']
 
-    def decide(self, player: Player, game_state: Dict[str, Any]) -> Tuple[Action, int]:
+    def decide(self, player: Player, game_state: GameState) -> Tuple[Action, int]:
         """
-        使用激进策略做出决策
+        按策略参数表做出决策
 
         Args:
             player: 做出决策的玩家
@@ -123,75 +222,30 @@ class AggressiveStrategy(PokerStrategy):
         Returns:
             (行动, 金额) 元组
         """
-        hand_strength = self._calculate_hand_strength(player.hand, game_state['community_cards'])
+        hand_strength = self._calculate_hand_strength(player.hand, game_state.community_cards)
+        thresholds, pot_fractions = self._table
 
-        current_bet = game_state['current_bet']
-        min_raise = game_state['min_raise']
-        pot_size = game_state['pot']
+        # 数值计算交给决策内核，这里只负责打包输入和还原行动
+        action_id, amount = _threshold_decide_kernel(
+            hand_strength, max(0, game_state.current_bet - player.current_bet),
+            game_state.min_raise, game_state.pot, player.chips, thresholds, pot_fractions
+        )
+        return _ACTIONS[action_id], amount
 
-        if current_bet > player.current_bet:
-            call_amount = current_bet - player.current_bet
 
-            # 更激进的加注条件
-            if hand_strength > 0.5 and player.chips > call_amount + min_raise:
-                raise_amount = min(int(pot_size * 0.75), player.chips)
-                return Action.RAISE, max(min_raise, raise_amount)
+class BasicStrategy(ThresholdStrategy):
+    """基础AI策略"""
 
-            elif hand_strength > 0.2 and player.chips >= call_amount:
-                return Action.CALL, call_amount
+    _table = STRATEGY_TABLES['basic']
 
-            else:
-                return Action.FOLD, 0
 
-        else:
-            # 更激进的加注条件
-            if hand_strength > 0.4:
-                bet_amount = min(int(pot_size * 0.5), player.chips)
-                return Action.RAISE, max(min_raise, bet_amount)
+class AggressiveStrategy(ThresholdStrategy):
+    """激进策略"""
 
-            else:
-                return Action.CHECK, 0
+    _table = STRATEGY_TABLES['aggressive']
 
 
-class ConservativeStrategy(PokerStrategy):
+class ConservativeStrategy(ThresholdStrategy):
     """保守策略"""
 
-    def decide(self, player: Player, game_state: Dict[str, Any]) -> Tuple[Action, int]:
-        """
-        使用保守策略做出决策
-
-        Args:
-            player: 做出决策的玩家
-            game_state: 当前游戏状态
-
-        Returns:
-            (行动, 金额) 元组
-        """
-        hand_strength = self._calculate_hand_strength(player.hand, game_state['community_cards'])
-
-        current_bet = game_state['current_bet']
-        min_raise = game_state['min_raise']
-        pot_size = game_state['pot']
-
-        if current_bet > player.current_bet:
-            call_amount = current_bet - player.current_bet
-
-            # 更保守的跟注条件
-            if hand_strength > 0.6 and player.chips > call_amount + min_raise:
-                raise_amount = min(int(pot_size * 0.3), player.chips)
-                return Action.RAISE, max(min_raise, raise_amount)
-
-            elif hand_strength > 0.4 and player.chips >= call_amount:
-                return Action.CALL, call_amount
-
-            else:
-                return Action.FOLD, 0
-
-        else:
-            # 更保守的加注条件
-            if hand_strength > 0.7:
-                bet_amount = min(int(pot_size * 0.2), player.chips)
-                return Action.RAISE, max(min_raise, bet_amount)
-
-            else:
-                return Action.CHECK, 0
\ No newline at end of file
+    _table = STRATEGY_TABLES['conservative']
@@ -1,9 +1,17 @@
-from enum import Enum
+from enum import IntEnum
 
 
-class Suit(Enum):
-    """扑克牌花色枚举"""
-    HEARTS = "♥"
-    DIAMONDS = "♦"
-    CLUBS = "♣"
-    SPADES = "♠"
\ No newline at end of file
+class Suit(IntEnum):
+    """扑克牌花色枚举（成员本身即为花色序号0-3）"""
+    HEARTS = 0
+    DIAMONDS = 1
+    CLUBS = 2
+    SPADES = 3
+
+    @property
+    def symbol(self) -> str:
+        """花色符号"""
+        return _SUIT_SYMBOLS[self]
+
+
+_SUIT_SYMBOLS = ("♥", "♦", "♣", "♠")
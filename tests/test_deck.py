@@ -0,0 +1,44 @@
+import unittest
+
+import numpy as np
+
+from card import CARDS, card_id, card_mask
+from deck import Deck, remaining_cards
+
+
+class RemainingCardsTest(unittest.TestCase):
+
+    def test_matches_set_difference(self):
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            dead = [CARDS[i] for i in rng.choice(52, rng.integers(0, 12), replace=False)]
+            expected = sorted(set(range(52)) - {card_id(card) for card in dead})
+            self.assertEqual(remaining_cards(card_mask(dead)).tolist(), expected)
+
+
+class SampleRunoutsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.deck = Deck(seed=7)
+        self.dead = [CARDS[0], CARDS[13], CARDS[26], CARDS[51], CARDS[30]]
+        self.dead_ids = {card_id(card) for card in self.dead}
+
+    def test_shape_and_no_dead_cards(self):
+        runouts = self.deck.sample_runouts(9, 2000, card_mask(self.dead))
+        self.assertEqual(runouts.shape, (2000, 9))
+        self.assertFalse(np.isin(runouts, list(self.dead_ids)).any())
+        self.assertTrue(((runouts >= 0) & (runouts < 52)).all())
+
+    def test_rows_are_distinct_cards(self):
+        runouts = self.deck.sample_runouts(9, 2000, card_mask(self.dead))
+        ordered = np.sort(runouts, axis=1)
+        self.assertTrue((np.diff(ordered.astype(np.int16), axis=1) > 0).all())
+
+    def test_seeded_deck_is_reproducible(self):
+        first = Deck(seed=3).sample_runouts(5, 100, card_mask(self.dead))
+        second = Deck(seed=3).sample_runouts(5, 100, card_mask(self.dead))
+        np.testing.assert_array_equal(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import contextlib
+import io
+import unittest
+
+from aiPlayer import AIPlayer
+from gameManager import GameManager
+from strategy import BasicStrategy
+
+
+def _manager(*names):
+    """由玩家名称构造使用基础策略的游戏管理器"""
+    manager = GameManager(verbose=False)
+    for name in names:
+        manager.add_player(AIPlayer(name, 1000, BasicStrategy()))
+    return manager
+
+
+class RemovePlayerTest(unittest.TestCase):
+
+    def assertIndexConsistent(self, manager):
+        expected = {}
+        for i, player in enumerate(manager.players):
+            expected.setdefault(player.name, []).append(i)
+        self.assertEqual(manager._name_idx, expected)
+
+    def test_keeps_seat_order(self):
+        manager = _manager("A", "B", "C", "D", "E")
+        manager.remove_player("B")
+        self.assertEqual([player.name for player in manager.players], ["A", "C", "D", "E"])
+        self.assertIndexConsistent(manager)
+
+    def test_removes_duplicate_names(self):
+        manager = _manager("A", "B", "C", "B", "D")
+        manager.remove_player("B")
+        self.assertEqual([player.name for player in manager.players], ["A", "C", "D"])
+        self.assertIndexConsistent(manager)
+        manager.remove_player("missing")
+        self.assertEqual(len(manager.players), 3)
+
+    def test_remove_during_game(self):
+        manager = _manager("A", "B", "C", "D", "E")
+        with contextlib.redirect_stdout(io.StringIO()):
+            manager.start_game(max_hands=3)
+        total_chips = sum(player.chips for player in manager.players)
+
+        # 三手牌后庄家在第4个座位，移除庄家之前的玩家
+        game = manager.game
+        self.assertEqual(game.dealer_position, 3)
+        dealer = game.players[game.dealer_position]
+        removed = manager.players[1]
+        manager.remove_player(removed.name)
+
+        # 牌局与管理器共享同一个玩家列表，庄家仍是同一名玩家
+        self.assertIs(game.players, manager.players)
+        self.assertIs(game.players[game.dealer_position], dealer)
+        self.assertNotIn(removed, manager.players)
+        self.assertIndexConsistent(manager)
+
+        # 剩余玩家继续进行牌局，筹码总数守恒
+        with contextlib.redirect_stdout(io.StringIO()):
+            for hand_num in range(4, 8):
+                manager._play_hand(hand_num)
+        self.assertEqual(sum(player.chips for player in manager.players), total_chips - removed.chips)
+
+
+if __name__ == "__main__":
+    unittest.main()
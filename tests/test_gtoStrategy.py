@@ -0,0 +1,30 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from gtoStrategy import GTOStrategy
+
+
+class RangeChartsTest(unittest.TestCase):
+
+    def test_missing_file_gives_empty_dict(self):
+        with mock.patch("gtoStrategy.RANGE_CHART_PATH", os.path.join(tempfile.gettempdir(), "missing.npz")):
+            self.assertEqual(GTOStrategy().range_charts, {})
+
+    def test_loads_plain_dict_of_arrays(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "ranges.npz")
+            np.savez(path, utg=np.arange(169), btn=np.ones(169))
+            with mock.patch("gtoStrategy.RANGE_CHART_PATH", path):
+                charts = GTOStrategy().range_charts
+            # 文件已关闭，临时目录可以直接删除
+        self.assertIs(type(charts), dict)
+        self.assertEqual(sorted(charts), ["btn", "utg"])
+        np.testing.assert_array_equal(charts["utg"], np.arange(169))
+
+
+if __name__ == "__main__":
+    unittest.main()
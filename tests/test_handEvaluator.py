@@ -0,0 +1,185 @@
+import unittest
+from itertools import combinations
+from unittest import mock
+
+import numpy as np
+
+from card import CARDS, Card, card_id
+from deck import Deck
+from handEvaluator import _ENCODED, EXACT_EQUITY_MAX_HANDS, HandEvaluator
+from jit import NUMBA_AVAILABLE
+from player import Player
+from rank import Rank
+from suit import Suit
+import strategy
+from texasHoldem import TexasHoldem
+
+
+def _cards(*specs):
+    """由(点数, 花色)元组列表构造牌列表"""
+    return [Card(Rank(rank), suit) for rank, suit in specs]
+
+
+_RANK_CHARS = {"T": 10, "J": 11, "Q": 12, "K": 13, "A": 14}
+_SUIT_CHARS = {"h": Suit.HEARTS, "s": Suit.SPADES, "d": Suit.DIAMONDS, "c": Suit.CLUBS}
+
+
+def _parse(text):
+    """由"Ah Kh"形式的字符串构造牌列表"""
+    return [Card(Rank(_RANK_CHARS.get(token[0]) or int(token[0])), _SUIT_CHARS[token[1]])
+            for token in text.split()]
+
+
+class HeartFlushTest(unittest.TestCase):
+    """红桃的花色值为0，同花判断不能按真值处理（回归测试）"""
+
+    def setUp(self):
+        self.flush = _cards((2, Suit.HEARTS), (5, Suit.HEARTS), (8, Suit.HEARTS), (11, Suit.HEARTS),
+                            (13, Suit.HEARTS), (3, Suit.SPADES), (3, Suit.CLUBS))
+        self.straight_flush = _cards((5, Suit.HEARTS), (6, Suit.HEARTS), (7, Suit.HEARTS), (8, Suit.HEARTS),
+                                     (9, Suit.HEARTS), (9, Suit.SPADES), (2, Suit.CLUBS))
+        self.straight = _cards((5, Suit.SPADES), (6, Suit.HEARTS), (7, Suit.CLUBS), (8, Suit.HEARTS),
+                               (9, Suit.DIAMONDS), (13, Suit.SPADES), (2, Suit.CLUBS))
+
+    def test_evaluate_hand(self):
+        self.assertEqual(HandEvaluator.rank_category(HandEvaluator.evaluate_hand(self.flush)), 5)
+        self.assertEqual(HandEvaluator.rank_category(HandEvaluator.evaluate_hand(self.straight_flush)), 8)
+        self.assertLess(HandEvaluator.evaluate_hand(self.flush), HandEvaluator.evaluate_hand(self.straight))
+
+    def test_evaluate_hand_without_numba(self):
+        with mock.patch("handEvaluator.NUMBA_AVAILABLE", False):
+            self.assertEqual(HandEvaluator.rank_category(HandEvaluator.evaluate_hand(self.flush)), 5)
+            self.assertEqual(HandEvaluator.rank_category(HandEvaluator.evaluate_hand(self.straight_flush)), 8)
+
+    def test_evaluate_batch(self):
+        ids = np.array([[card_id(card) for card in hand]
+                        for hand in (self.flush, self.straight_flush, self.straight)])
+        categories = (HandEvaluator.evaluate_batch(ids) >> 20).tolist()
+        self.assertEqual(categories, [5, 8, 4])
+
+    def test_evaluate_ranks(self):
+        ids = np.array([[card_id(card) for card in hand] for hand in (self.flush, self.straight_flush)])
+        ranks = HandEvaluator.evaluate_ranks(ids).tolist()
+        self.assertEqual([HandEvaluator.rank_category(rank) for rank in ranks], [5, 8])
+
+
+class EstimateEquityTest(unittest.TestCase):
+
+    def test_aces_against_random_hand_preflop(self):
+        # AA对一个随机手牌的胜率约为0.85
+        equity = HandEvaluator.estimate_equity(_parse("Ah As"), [], Deck(seed=11), 1, 20000)
+        self.assertAlmostEqual(equity, 0.852, delta=0.015)
+
+    def test_matches_exact_equity_on_river(self):
+        hand, board = _parse("Td 9d"), _parse("9s 4c 8h Jd 2s")
+        equity = HandEvaluator.estimate_equity(hand, board, Deck(seed=5), 1, 20000)
+        self.assertAlmostEqual(equity, HandEvaluator.exact_equity(hand, board), delta=0.015)
+
+
+class ExactEquityTest(unittest.TestCase):
+
+    def test_nut_hand_on_river(self):
+        self.assertEqual(HandEvaluator.exact_equity(_parse("Ah Kh"), _parse("Qh Jh Th 2c 3d")), 1.0)
+
+    def test_drawing_dead_on_turn(self):
+        # 对手已成四条A，一张河牌无法反超
+        equity = HandEvaluator.exact_equity(_parse("2c 2d"), _parse("Ad Ac Ks 7h"), _parse("As Ah"))
+        self.assertEqual(equity, 0.0)
+
+    def test_flush_draw_outs_on_turn(self):
+        # 对QQ: 9张红桃 + 3张A + 3张K 共15张补牌获胜，剩余44张牌
+        equity = HandEvaluator.exact_equity(_parse("Ah Kh"), _parse("2h 7h 9c Js"), _parse("Qc Qd"))
+        self.assertEqual(equity, 15 / 44)
+
+    def test_random_opponent_matches_brute_force(self):
+        hand, board = _parse("Td 9d"), _parse("9s 4c 8h Jd 2s")
+        hero = HandEvaluator.evaluate_hand(hand + board)
+        dead = set(hand + board)
+        rest = [card for card in CARDS if card not in dead]
+        wins = 0.0
+        for opponent in combinations(rest, 2):
+            rank = HandEvaluator.evaluate_hand(list(opponent) + board)
+            wins += (hero < rank) + 0.5 * (hero == rank)
+        self.assertAlmostEqual(HandEvaluator.exact_equity(hand, board), wins / 990, places=12)
+
+    def test_hand_count(self):
+        self.assertEqual(HandEvaluator.exact_equity_hands(_parse("2h 7h 9c Js 3d")), 990)
+        self.assertEqual(HandEvaluator.exact_equity_hands(_parse("2h 7h 9c Js")), 46 * 990)
+
+
+@unittest.skipUnless(NUMBA_AVAILABLE, "精确枚举只在有numba时启用")
+class EquityCutoffTest(unittest.TestCase):
+    """_mc_equity在枚举规模超过EXACT_EQUITY_MAX_HANDS时回退到蒙特卡洛"""
+
+    def _route(self, board, max_hands=EXACT_EQUITY_MAX_HANDS, n_opp=1):
+        with mock.patch.object(HandEvaluator, "exact_equity", return_value=1.0) as exact, \
+                mock.patch.object(HandEvaluator, "estimate_equity", return_value=0.5) as sampled, \
+                mock.patch("strategy.EXACT_EQUITY_MAX_HANDS", max_hands):
+            strategy._mc_equity(tuple(_parse("Ah Kh")), tuple(board), n_opp)
+        return exact.called, sampled.called
+
+    def test_river_is_exact(self):
+        self.assertEqual(self._route(_parse("2h 7h 9c Js 3d")), (True, False))
+
+    def test_turn_falls_back_to_monte_carlo(self):
+        self.assertEqual(self._route(_parse("2h 7h 9c Js")), (False, True))
+
+    def test_lower_budget_and_more_opponents_fall_back(self):
+        self.assertEqual(self._route(_parse("2h 7h 9c Js 3d"), max_hands=989), (False, True))
+        self.assertEqual(self._route(_parse("2h 7h 9c Js 3d"), n_opp=2), (False, True))
+
+
+class ShowdownTest(unittest.TestCase):
+    """TexasHoldem._determine_winner通过evaluate_codes_batch一次评估所有摊牌手牌"""
+
+    def _winners(self, board, *hands, folded=()):
+        players = [Player(f"P{i}") for i in range(len(hands))]
+        game = TexasHoldem(players)
+        for i, (player, hand) in enumerate(zip(players, hands)):
+            player.hand = _parse(hand)
+            player.folded = i in folded
+        game.community_cards = _parse(board)
+        game._board[:5] = game.community_cards
+        game._board_len = 5
+        return [player.name for player, _ in game._determine_winner()]
+
+    def test_players_playing_the_board_split(self):
+        # 公共牌是A高顺子，三人都只能用公共牌，平分底池
+        self.assertEqual(self._winners("Ts Jd Qh Kc Ad", "2c 3d", "4s 5h", "6c 7c"),
+                         ["P0", "P1", "P2"])
+
+    def test_kicker_breaks_tie(self):
+        # 都是一对A，K踢脚胜过Q踢脚
+        self.assertEqual(self._winners("As 8d 5h 3c 2s", "Ah Kc", "Ad Qc"), ["P0"])
+
+    def test_equal_kickers_split(self):
+        self.assertEqual(self._winners("As Kd 9h 7c 2s", "Ah 4c", "Ad 3c", "8s 6s"), ["P0", "P1"])
+
+    def test_folded_players_are_skipped(self):
+        self.assertEqual(self._winners("As 8d 5h 3c 2s", "Ah Kc", "Ad Qc", "Kd Kh", folded=(0,)), ["P1"])
+
+    def test_batch_matches_single_evaluation(self):
+        rng = np.random.default_rng(4)
+        hands = np.array([_ENCODED[rng.choice(52, 7, replace=False)] for _ in range(500)], dtype=np.int32)
+        expected = [HandEvaluator.evaluate_codes(hand) for hand in hands]
+        self.assertEqual(HandEvaluator.evaluate_codes_batch(hands).tolist(), expected)
+        with mock.patch("handEvaluator.NUMBA_AVAILABLE", False):
+            self.assertEqual(HandEvaluator.evaluate_codes_batch(hands[:50]).tolist(), expected[:50])
+
+
+class EvaluateBatchTest(unittest.TestCase):
+    """evaluate_batch在numpy上的结果与evaluate_ranks给出相同的强弱顺序"""
+
+    def test_numpy_path_orders_like_ranks(self):
+        rng = np.random.default_rng(9)
+        hands = np.array([rng.choice(52, 7, replace=False) for _ in range(2000)], dtype=np.uint8)
+        scores = HandEvaluator.evaluate_batch(hands, xp=np)
+        ranks = HandEvaluator.evaluate_ranks(hands)
+        self.assertIsInstance(scores, np.ndarray)
+        # 分数越大越强、等级编号越小越强，两两比较的结果必须一致（包括平局）
+        self.assertTrue(np.array_equal(np.sign(scores[:, None] - scores[None, :]),
+                                       np.sign(ranks[None, :].astype(np.int64) - ranks[:, None])))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import itertools
+import unittest
+from unittest import mock
+
+from action import Action
+from card import CARDS
+from deck import Deck
+from gameState import GameState
+from jit import NUMBA_AVAILABLE
+from player import Player
+from strategy import AggressiveStrategy, BasicStrategy, ConservativeStrategy, clear_hand_strength_cache
+
+
+def _reference_decide(raise_threshold, call_threshold, bet_threshold, raise_fraction, bet_fraction,
+                      hand_strength, player, game_state):
+    """改为查表之前各策略手写的if/elif决策树"""
+    if game_state.current_bet > player.current_bet:
+        call_amount = game_state.current_bet - player.current_bet
+        if hand_strength > raise_threshold and player.chips > call_amount + game_state.min_raise:
+            raise_amount = min(int(game_state.pot * raise_fraction), player.chips)
+            return Action.RAISE, max(game_state.min_raise, raise_amount)
+        elif hand_strength > call_threshold and player.chips >= call_amount:
+            return Action.CALL, call_amount
+        return Action.FOLD, 0
+    if hand_strength > bet_threshold:
+        bet_amount = min(int(game_state.pot * bet_fraction), player.chips)
+        return Action.RAISE, max(game_state.min_raise, bet_amount)
+    return Action.CHECK, 0
+
+
+# 各策略原决策树中的参数: 加注阈值, 跟注阈值, 主动下注阈值, 加注底池比例, 主动下注底池比例
+_REFERENCE_PARAMS = {
+    BasicStrategy: (0.7, 0.3, 0.6, 0.5, 0.3),
+    AggressiveStrategy: (0.5, 0.2, 0.4, 0.75, 0.5),
+    ConservativeStrategy: (0.6, 0.4, 0.7, 0.3, 0.2),
+}
+
+_STRENGTHS = (0.0, 0.1, 0.2, 0.25, 0.3, 0.35, 0.4, 0.45, 0.5, 0.55, 0.6, 0.65, 0.7, 0.75, 0.9, 1.0)
+_CALL_AMOUNTS = (0, 10, 20, 50, 200, 990, 1500)
+_POTS = (0, 30, 45, 100, 333, 1000, 4000)
+_CHIPS = (0, 15, 500, 1000)
+
+
+def _decide(strategy, hand_strength, call_amount, pot, chips, min_raise=20):
+    """以给定手牌强度驱动策略做一次决策"""
+    player = Player("P", chips)
+    player.current_bet = 20
+    game_state = GameState([], player.current_bet + call_amount, min_raise, pot)
+    with mock.patch.object(type(strategy), "_calculate_hand_strength", return_value=hand_strength):
+        return strategy.decide(player, game_state), player, game_state
+
+
+class ThresholdStrategyTest(unittest.TestCase):
+
+    def test_matches_original_decision_trees(self):
+        for cls, params in _REFERENCE_PARAMS.items():
+            strategy = cls()
+            for strength, call, pot, chips in itertools.product(_STRENGTHS, _CALL_AMOUNTS, _POTS, _CHIPS):
+                result, player, game_state = _decide(strategy, strength, call, pot, chips)
+                self.assertEqual(result, _reference_decide(*params, strength, player, game_state),
+                                 (cls.__name__, strength, call, pot, chips))
+
+    def test_fixed_outputs(self):
+        cases = [
+            # (策略, 手牌强度, 跟注额, 底池, 筹码) -> (行动, 金额)
+            (BasicStrategy, 0.8, 20, 200, 1000, (Action.RAISE, 100)),
+            (BasicStrategy, 0.5, 20, 200, 1000, (Action.CALL, 20)),
+            (BasicStrategy, 0.2, 20, 200, 1000, (Action.FOLD, 0)),
+            (BasicStrategy, 0.65, 0, 200, 1000, (Action.RAISE, 60)),
+            (BasicStrategy, 0.5, 0, 200, 1000, (Action.CHECK, 0)),
+            (AggressiveStrategy, 0.55, 20, 200, 1000, (Action.RAISE, 150)),
+            (AggressiveStrategy, 0.25, 20, 200, 1000, (Action.CALL, 20)),
+            (AggressiveStrategy, 0.45, 0, 200, 1000, (Action.RAISE, 100)),
+            (AggressiveStrategy, 0.45, 0, 20, 1000, (Action.RAISE, 20)),
+            (ConservativeStrategy, 0.65, 20, 200, 1000, (Action.RAISE, 60)),
+            (ConservativeStrategy, 0.35, 20, 200, 1000, (Action.FOLD, 0)),
+            (ConservativeStrategy, 0.65, 0, 200, 1000, (Action.CHECK, 0)),
+            (ConservativeStrategy, 0.75, 0, 200, 1000, (Action.RAISE, 40)),
+            # 筹码不足以加注时退而跟注
+            (BasicStrategy, 0.9, 990, 4000, 1000, (Action.CALL, 990)),
+        ]
+        for cls, strength, call, pot, chips, expected in cases:
+            result, _, _ = _decide(cls(), strength, call, pot, chips)
+            self.assertEqual(result, expected, (cls.__name__, strength, call, pot, chips))
+
+
+class DecideManyTest(unittest.TestCase):
+    """翻牌前查表和河牌圈精确枚举都是确定的，并行结果应与逐个决策一致"""
+
+    def setUp(self):
+        clear_hand_strength_cache()
+        deck = Deck(seed=21)
+        self.players = []
+        for i in range(6):
+            player = Player(f"P{i}", 1000)
+            player.hand = [CARDS[card] for card in deck.deal_many(2).tolist()]
+            player.current_bet = 0
+            self.players.append(player)
+        self.board = [CARDS[card] for card in deck.deal_many(5).tolist()]
+
+    def _assert_matches_serial(self, strategy, game_state):
+        serial = [strategy.decide(player, game_state) for player in self.players]
+        clear_hand_strength_cache()
+        self.assertEqual(strategy.decide_many(self.players, game_state), serial)
+
+    def test_preflop(self):
+        for cls in _REFERENCE_PARAMS:
+            self._assert_matches_serial(cls(), GameState([], 20, 20, 30))
+
+    @unittest.skipUnless(NUMBA_AVAILABLE, "河牌圈精确枚举只在有numba时启用")
+    def test_river(self):
+        for cls in _REFERENCE_PARAMS:
+            self._assert_matches_serial(cls(), GameState(self.board, 40, 20, 300))
+            self._assert_matches_serial(cls(), GameState(self.board, 0, 20, 300))
+
+    def test_workers_have_own_decks(self):
+        strategy = BasicStrategy()
+        workers = [strategy._worker() for _ in range(3)]
+        decks = {id(worker._sim_deck) for worker in workers} | {id(strategy._sim_deck)}
+        self.assertEqual(len(decks), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import contextlib
+import io
+import unittest
+
+from action import Action
+from player import Player
+from texasHoldem import TexasHoldem
+
+
+class ScriptedPlayer(Player):
+    """按固定规则行动的玩家，记录每次决策时已发出的公共牌数"""
+
+    def __init__(self, name: str, chips: int, action: Action):
+        super().__init__(name, chips)
+        self.action = action
+        self.decisions = []
+
+    def make_decision(self, game_state):
+        self.decisions.append(len(game_state.community_cards))
+        if self.action == Action.CALL:
+            call_amount = game_state.current_bet - self.current_bet
+            return (Action.CALL, call_amount) if call_amount > 0 else (Action.CHECK, 0)
+        return self.action, 0
+
+
+def _play_hand(players):
+    """静默进行一手牌"""
+    game = TexasHoldem(players)
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.start_hand()
+    return game
+
+
+class BettingFlowTest(unittest.TestCase):
+
+    def test_heads_up_all_in_runs_out_the_board(self):
+        short = ScriptedPlayer("Short", 100, Action.ALL_IN)
+        caller = ScriptedPlayer("Caller", 1000, Action.CALL)
+        game = _play_hand([short, caller])
+
+        # 翻牌前短码全下、对手跟注后没有人还能下注，剩余公共牌直接发完
+        self.assertEqual(len(game.community_cards), 5)
+        self.assertEqual(set(caller.decisions), {0})
+        self.assertEqual(set(short.decisions), {0})
+        self.assertEqual(short.chips + caller.chips, 1100)
+
+    def test_round_ends_when_everyone_else_folds(self):
+        players = [ScriptedPlayer("P0", 1000, Action.FOLD), ScriptedPlayer("P1", 1000, Action.FOLD),
+                   ScriptedPlayer("P2", 1000, Action.FOLD)]
+        game = _play_hand(players)
+
+        # 枪口位和小盲弃牌后大盲直接赢下盲注，不会再被要求行动（也就不会弃掉最后一手牌）
+        self.assertEqual(players[2].decisions, [])
+        self.assertEqual(game.community_cards, [])
+        self.assertEqual([player.chips for player in players], [1000, 990, 1010])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,17 +1,21 @@
 from action import Action
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
 
-from card import Card
+import numpy as np
+
+from card import Card, CARDS
 from deck import Deck
+from gameState import GameState
 from handEvaluator import HandEvaluator
 from player import Player
-from strategy import BasicStrategy
+from strategy import BasicStrategy, clear_hand_strength_cache
 
 
 class TexasHoldem:
     """德州扑克主游戏类"""
 
-    def __init__(self, players: List[Player], small_blind: int = 10, big_blind: int = 20):
+    def __init__(self, players: List[Player], small_blind: int = 10, big_blind: int = 20,
+                 deck: Optional[Deck] = None):
         """
         初始化德州扑克游戏
 
@@ -19,25 +23,34 @@ class TexasHoldem:
             players: 玩家列表
             small_blind: 小盲注金额
             big_blind: 大盲注金额
-            deck:牌堆
+            deck: 牌堆，每手牌开始时重置复用，为None时新建
         """
-        self.players = players
-        self.small_blind = small_blind
-        self.big_blind = big_blind
-        self.deck = Deck()
-        self.community_cards = []
-        self.pot = 0
-        self.current_bet = 0
-        self.min_raise = big_blind
-        self.dealer_position = 0
+        self.players: List[Player] = players
+        self.small_blind: int = small_blind
+        self.big_blind: int = big_blind
+        self.deck: Deck = deck if deck is not None else Deck()
+        self.community_cards: List[Card] = []
+        # 公共牌的定长编码数组和已发张数，摊牌评估直接使用，不再拼接列表
+        self._board = np.zeros(5, dtype=np.int32)
+        self._board_len: int = 0
+        # 摊牌时复用的(玩家数, 7)牌缓冲区，每行为一名玩家的手牌加公共牌
+        self._showdown_hands = np.zeros((len(players), 7), dtype=np.int32)
+        self.pot: int = 0
+        self.current_bet: int = 0
+        self.min_raise: int = big_blind
+        # 未弃牌的玩家数，弃牌时递减
+        self._active_count: int = len(players)
+        self.dealer_position: int = 0
         self.hand_evaluator = HandEvaluator()
-        self.hand_history = []
+        self.hand_history: List[Dict[str, Any]] = []
 
     def start_hand(self):
         """开始新的一手牌"""
         # 重置游戏状态
-        self.deck = Deck()
+        self.deck.reset()
+        clear_hand_strength_cache()
         self.community_cards = []
+        self._board_len = 0
         self.pot = 0
         self.current_bet = 0
         self.min_raise = self.big_blind
@@ -45,6 +58,7 @@ class TexasHoldem:
         # 重置玩家状态
         for player in self.players:
             player.reset_hand()
+        self._active_count = len(self.players)
 
         # 发牌
         self._deal_hole_cards()
@@ -53,10 +67,13 @@ class TexasHoldem:
         self._post_blinds()
 
         # 进行下注轮次
-        self._run_betting_rounds()
+        showdown_needed = self._run_betting_rounds()
 
-        # 摊牌并分配底池
-        winners = self._determine_winner()
+        # 摊牌并分配底池；其他人都弃牌时剩下的玩家直接获胜，无需评估牌力
+        if showdown_needed:
+            winners = self._determine_winner()
+        else:
+            winners = [(player, player.hand) for player in self.players if not player.folded]
         self._distribute_pot(winners)
 
         # 记录手牌历史
@@ -66,11 +83,11 @@ class TexasHoldem:
         self.dealer_position = (self.dealer_position + 1) % len(self.players)
 
     def _deal_hole_cards(self):
-        """发底牌"""
-        for _ in range(2):
-            for player in self.players:
-                if not player.folded:
-                    player.receive_cards([self.deck.deal()])
+        """发底牌（所有底牌一次从牌堆切出，再两张一组分给玩家）"""
+        players = [player for player in self.players if not player.folded]
+        hole_cards = self.deck.deal_many(2 * len(players)).tolist()
+        for i, player in enumerate(players):
+            player.receive_cards([CARDS[hole_cards[2 * i]], CARDS[hole_cards[2 * i + 1]]])
 
     def _post_blinds(self):
         """下盲注"""
@@ -93,8 +110,13 @@ class TexasHoldem:
         print(f"Blinds: {small_blind_player.name} posts small blind ${sb_bet}, "
               f"{big_blind_player.name} posts big blind ${bb_bet}")
 
-    def _run_betting_rounds(self):
-        """运行所有下注轮次"""
+    def _run_betting_rounds(self) -> bool:
+        """
+        运行所有下注轮次
+
+        Returns:
+            是否需要摊牌（下注结束时仍有至少两名玩家未弃牌）
+        """
         betting_rounds = [
             ("Pre-flop", 0),
             ("Flop", 3),
@@ -103,9 +125,9 @@ class TexasHoldem:
         ]
 
         for round_name, community_cards_count in betting_rounds:
-            # 如果只剩一个活跃玩家，提前结束
+            # 如果只剩一个活跃玩家，提前结束，剩余的公共牌也不再发出
             if self._active_players_count() <= 1:
-                break
+                return False
 
             print(f"\n--- {round_name} ---")
 
@@ -113,14 +135,20 @@ class TexasHoldem:
             if community_cards_count > 0:
                 self._deal_community_cards(community_cards_count)
 
+                # 翻牌后最多只有一名玩家还能行动（其余都已全下）时无需下注
+                if self._live_players_count() <= 1:
+                    continue
+
             # 进行下注轮
             self._betting_round()
 
+        return self._active_players_count() > 1
+
     def _deal_community_cards(self, count: int):
         """发公共牌"""
-        for _ in range(count):
-            card = self.deck.deal()
-            self.community_cards.append(card)
+        self.community_cards.extend(CARDS[i] for i in self.deck.deal_many(count).tolist())
+        self._board[self._board_len:self._board_len + count] = self.community_cards[self._board_len:]
+        self._board_len += count
 
         print(f"Community cards: {self.community_cards}")
 
@@ -137,19 +165,13 @@ class TexasHoldem:
         last_raiser = None
         current_pos = start_pos
         actions_taken = 0
+        # 本轮所有玩家共享的游戏状态，每次行动后原地更新
+        game_state = GameState(self.community_cards, self.current_bet, self.min_raise, self.pot)
 
         while actions_taken < len(self.players) or (last_raiser is not None and current_pos != last_raiser):
             player = self.players[current_pos]
 
             if not player.folded and not player.all_in:
-                # 获取游戏状态
-                game_state = {
-                    'community_cards': self.community_cards,
-                    'current_bet': self.current_bet,
-                    'min_raise': self.min_raise,
-                    'pot': self.pot
-                }
-
                 # 玩家决策
                 if hasattr(player, 'make_decision'):
                     action, amount = player.make_decision(game_state)
@@ -160,6 +182,13 @@ class TexasHoldem:
 
                 # 执行行动
                 self._execute_action(player, action, amount)
+                game_state.current_bet = self.current_bet
+                game_state.min_raise = self.min_raise
+                game_state.pot = self.pot
+
+                # 其他玩家都已弃牌，本轮下注结束
+                if self._active_count <= 1:
+                    break
 
                 # 记录最后一个加注者
                 if action == Action.RAISE or action == Action.ALL_IN:
@@ -176,6 +205,7 @@ class TexasHoldem:
         """执行玩家行动"""
         if action == Action.FOLD:
             player.folded = True
+            self._active_count -= 1
             print(f"\n{player.name} folds")
 
         elif action == Action.CHECK:
@@ -183,6 +213,7 @@ class TexasHoldem:
             if self.current_bet > player.current_bet:
                 # 无效的检查，转换为弃牌
                 player.folded = True
+                self._active_count -= 1
                 print(f"\n{player.name} cannot check, folds instead")
             else:
                 print(f"\n{player.name} checks")
@@ -224,8 +255,12 @@ class TexasHoldem:
                 print(f"\n{player.name} calls all-in with ${all_in_amount}")
 
     def _active_players_count(self) -> int:
-        """计算未弃牌的玩家数量"""
-        return sum(1 for player in self.players if not player.folded)
+        """未弃牌的玩家数量（由_execute_action增量维护）"""
+        return self._active_count
+
+    def _live_players_count(self) -> int:
+        """计算还能行动（未弃牌且未全下）的玩家数量"""
+        return sum(1 for player in self.players if not player.folded and not player.all_in)
 
     def _determine_winner(self) -> List[Tuple[Player, List[Card]]]:
         """确定获胜者"""
@@ -238,30 +273,20 @@ class TexasHoldem:
         if len(active_players) == 1:
             return [(active_players[0][0], active_players[0][1])]
 
-        # 评估每个玩家的牌力
-        player_hands = []
-        for player, hand in active_players:
-            all_cards = hand + self.community_cards
-            hand_rank, kickers = self.hand_evaluator.evaluate_hand(all_cards)
-            player_hands.append((player, hand_rank, kickers, all_cards))
-
-        # 找出最佳手牌
-        best_hand_rank = max(hand_rank for _, hand_rank, _, _ in player_hands)
-        best_players = [(player, cards) for player, hand_rank, _, cards in player_hands if hand_rank == best_hand_rank]
-
-        # 如果有平局，比较踢子
-        if len(best_players) > 1:
-            # 获取最佳踢子
-            best_kickers = []
-            for _, hand_rank, kickers, _ in player_hands:
-                if hand_rank == best_hand_rank:
-                    if not best_kickers or kickers > best_kickers:
-                        best_kickers = kickers
-
-            best_players = [(player, cards) for player, hand_rank, kickers, cards in player_hands
-                            if hand_rank == best_hand_rank and kickers == best_kickers]
-
-        return best_players
+        # 评估每个玩家的牌力，等级编号越小越强，踢子已包含在编号中
+        # 玩家手牌逐行写入缓冲区（公共牌整列写入一次），一次批量评估
+        if len(active_players) > self._showdown_hands.shape[0]:
+            self._showdown_hands = np.zeros((len(active_players), 7), dtype=np.int32)
+        hands = self._showdown_hands[:len(active_players), :2 + self._board_len]
+        hands[:, 2:] = self._board[:self._board_len]
+        for row, (_, hand) in enumerate(active_players):
+            hands[row, :2] = hand
+        player_ranks = self.hand_evaluator.evaluate_codes_batch(hands).tolist()
+
+        # 找出最佳手牌，编号相同即为平局
+        best_rank = min(player_ranks)
+        return [(player, player.hand + self.community_cards)
+                for (player, _), rank in zip(active_players, player_ranks) if rank == best_rank]
 
     def _distribute_pot(self, winners: List[Tuple[Player, List[Card]]]):
         """分配底池"""